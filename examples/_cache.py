@@ -0,0 +1,72 @@
+"""Persistent on-disk cache for the example scripts.
+
+Results are stored as JSON in a small SQLite database so repeated runs of the
+examples (and repeated lookups within an interactive session) skip the network.
+"""
+
+import asyncio
+import functools
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from pydantic import BaseModel
+
+GEOCODE_CACHE_PATH = "~/.cache/open-meteo/geocode.sqlite"
+GEOCODE_CACHE_TTL = 86400 * 30  # Place names and coordinates rarely change
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, stored_at REAL)"
+    )
+    return conn
+
+
+def _get(db_path: Path, key: str, ttl: float) -> str | None:
+    with closing(_connect(db_path)) as conn:
+        row = conn.execute("SELECT value, stored_at FROM cache WHERE key = ?", (key,)).fetchone()
+    if row is None or time.time() - row[1] > ttl:
+        return None
+    return row[0]
+
+
+def _set(db_path: Path, key: str, value: str) -> None:
+    # closing() releases the connection; the inner block only commits the transaction
+    with closing(_connect(db_path)) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, stored_at) VALUES (?, ?, ?)",
+            (key, value, time.time()),
+        )
+
+
+def disk_cached(model: type[BaseModel], path: str, ttl: float):
+    """Cache an async tool's Pydantic result on disk, keyed by its arguments.
+
+    Args:
+        model: The Pydantic model the wrapped coroutine returns.
+        path: SQLite database path (``~`` is expanded).
+        ttl: Time-to-live for cached entries in seconds.
+    """
+    db_path = Path(path).expanduser()
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = hashlib.blake2b(repr((args, sorted(kwargs.items()))).encode()).hexdigest()
+
+            cached = await asyncio.to_thread(_get, db_path, key, ttl)
+            if cached is not None:
+                return model.model_validate_json(cached)
+
+            result = await func(*args, **kwargs)
+            await asyncio.to_thread(_set, db_path, key, result.model_dump_json())
+            return result
+
+        return wrapper
+
+    return decorator
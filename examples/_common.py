@@ -0,0 +1,174 @@
+"""Helpers shared by the example scripts."""
+
+import asyncio
+import math
+import sys
+import threading
+from bisect import bisect_left
+from collections.abc import Coroutine, Sequence
+from itertools import islice
+from typing import Any, NamedTuple, TypeVar
+
+from _cache import GEOCODE_CACHE_PATH, GEOCODE_CACHE_TTL, disk_cached
+
+from chuk_mcp_open_meteo.models import DailyWeather, GeocodingResponse, GeocodingResult
+from chuk_mcp_open_meteo.server import geocode_location as _geocode_location
+
+# Repeated city lookups are served from disk across runs
+geocode_location = disk_cached(GeocodingResponse, GEOCODE_CACHE_PATH, GEOCODE_CACHE_TTL)(
+    _geocode_location
+)
+
+T = TypeVar("T")
+
+# Daily precipitation (mm) above which a day counts as rainy
+RAINY_DAY_MM = 0.1
+
+# US AQI category upper bounds (inclusive) and the matching (status, advice) labels
+_AQI_BOUNDS = (50, 100, 150, 200)
+_AQI_LABELS = (
+    ("Good 😊", "Air quality is satisfactory"),
+    ("Moderate 😐", "Acceptable for most people"),
+    ("Unhealthy for Sensitive Groups 😷", "Sensitive groups should limit outdoor activity"),
+    ("Unhealthy 😨", "Everyone should reduce prolonged outdoor exertion"),
+    ("Very Unhealthy/Hazardous ⚠️", "Avoid outdoor activities"),
+)
+
+
+async def geocode_first(name: str) -> tuple[float, float, GeocodingResult] | None:
+    """Geocode a place name and return (latitude, longitude, location) for the best match.
+
+    Returns None if the name could not be found.
+    """
+    locations = await geocode_location(name=name, count=1)
+    if not locations.results:
+        return None
+    location = locations.results[0]
+    return location.latitude, location.longitude, location
+
+
+def run_main(main: Coroutine[Any, Any, T]) -> T:
+    """Run an example's entry coroutine, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    input() runs on a daemon thread, so background tasks keep running while the
+    user types and a pending prompt never holds up interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def resolve(setter, value) -> None:
+        if not future.done():
+            setter(value)
+
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except (EOFError, KeyboardInterrupt) as exc:
+            loop.call_soon_threadsafe(resolve, future.set_exception, exc)
+        except Exception as exc:
+            # Unexpected: fail the awaiting caller, and let the thread report it too
+            loop.call_soon_threadsafe(resolve, future.set_exception, exc)
+            raise
+        else:
+            loop.call_soon_threadsafe(resolve, future.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+def emit(lines: list[str]) -> None:
+    """Write buffered output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def render_daily(daily: DailyWeather, days: int) -> None:
+    """Print one line per day: date, low/high temperature and precipitation."""
+    precip = daily.precipitation_sum or [0.0] * len(daily.time)
+    rows = zip(daily.time, daily.temperature_2m_min, daily.temperature_2m_max, precip)
+    emit(
+        [
+            f"  {date}: {tmin}°C - {tmax}°C, {f'{p}mm' if p > 0 else 'No rain'}"
+            for date, tmin, tmax, p in islice(rows, days)
+        ]
+    )
+
+
+class DailyColumns(NamedTuple):
+    """The daily forecast columns the examples read, with missing ones filled in."""
+
+    time: list[str]
+    tmax: Sequence[float]
+    tmin: Sequence[float]
+    psum: Sequence[float]
+    phrs: Sequence[float]
+    sunrise: list[str | None]
+    sunset: list[str | None]
+
+
+def daily_columns(daily: DailyWeather) -> DailyColumns:
+    """Resolve the optional daily series once so loops can zip plain sequences.
+
+    Missing numeric series become empty sequences. Missing sun times are padded
+    with None so they never truncate a zip over the other columns.
+    """
+    n = len(daily.time)
+    return DailyColumns(
+        daily.time,
+        daily.column("temperature_2m_max"),
+        daily.column("temperature_2m_min"),
+        daily.column("precipitation_sum"),
+        daily.column("precipitation_hours"),
+        daily.sunrise or [None] * n,
+        daily.sunset or [None] * n,
+    )
+
+
+def aqi_label(aqi: float) -> tuple[str, str]:
+    """Return the (status, advice) pair for a US AQI value."""
+    return _AQI_LABELS[bisect_left(_AQI_BOUNDS, aqi)]
+
+
+class SeriesSummary(NamedTuple):
+    """Aggregates of a numeric series computed in one pass."""
+
+    mean: float
+    min: float
+    max: float
+    total: float
+    missing: int
+    above: int
+
+
+def summarize(values, threshold: float = math.inf) -> SeriesSummary:
+    """Summarize a series in a single pass, skipping missing (None/NaN) values.
+
+    Args:
+        values: Numeric series, e.g. ``daily.temperature_2m_max``.
+        threshold: Count of values strictly above this is returned as ``above``,
+            e.g. ``RAINY_DAY_MM`` to count rainy days alongside the total.
+    """
+    total = 0.0
+    lo = math.inf
+    hi = -math.inf
+    count = missing = above = 0
+    for v in values:
+        if v is None or math.isnan(v):
+            missing += 1
+            continue
+        count += 1
+        total += v
+        lo = min(lo, v)
+        hi = max(hi, v)
+        if v > threshold:
+            above += 1
+    mean = total / count if count else math.nan
+    return SeriesSummary(mean, lo, hi, total, missing, above)
@@ -6,15 +6,24 @@ without going through the MCP protocol. All tools return Pydantic models
 for type-safe access.
 """
 
-import asyncio
+from statistics import fmean
+import httpx
 from chuk_mcp_open_meteo.server import (
     get_weather_forecast,
     geocode_location,
     get_historical_weather,
     get_air_quality,
     get_marine_forecast,
+    set_shared_client,
 )
 
+from _common import run_main
+
+
+def _stats(values):
+    """Return (mean, min, max) of a numeric series."""
+    return fmean(values), min(values), max(values)
+
 
 async def main():
     """Run basic examples of each tool."""
@@ -89,13 +98,13 @@ async def main():
     if historical.daily:
         daily = historical.daily
         if daily.temperature_2m_max and daily.temperature_2m_min:
-            avg_high = sum(daily.temperature_2m_max) / len(daily.temperature_2m_max)
-            avg_low = sum(daily.temperature_2m_min) / len(daily.temperature_2m_min)
+            avg_high, _, warmest = _stats(daily.temperature_2m_max)
+            avg_low, coldest, _ = _stats(daily.temperature_2m_min)
 
             print(f"Average High: {avg_high:.1f}°C")
             print(f"Average Low: {avg_low:.1f}°C")
-            print(f"Coldest Day: {min(daily.temperature_2m_min)}°C")
-            print(f"Warmest Day: {max(daily.temperature_2m_max)}°C")
+            print(f"Coldest Day: {coldest}°C")
+            print(f"Warmest Day: {warmest}°C")
     print()
 
     # Example 5: Air quality
@@ -145,5 +154,18 @@ async def main():
     print("=" * 80)
 
 
+async def run():
+    """Run main() with one pooled HTTP client shared by every tool call."""
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+        timeout=10.0,
+    ) as client:
+        set_shared_client(client)
+        try:
+            return await main()
+        finally:
+            set_shared_client(None)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_main(run())
@@ -7,196 +7,221 @@ checking weather forecasts and air quality for your destination.
 
 import asyncio
 from datetime import datetime
+from typing import NamedTuple
+import httpx
 from chuk_mcp_open_meteo.server import (
-    geocode_location,
     get_weather_forecast,
     get_air_quality,
+    set_shared_client,
 )
 
+from _common import (
+    RAINY_DAY_MM,
+    aqi_label,
+    daily_columns,
+    emit,
+    geocode_first,
+    run_main,
+    summarize,
+)
 
-async def plan_trip(destination: str, days: int = 7):
-    """Plan a trip by checking weather and air quality.
+TRIPS = (("Rome, Italy", 7), ("Tokyo, Japan", 5), ("New York, USA", 7))
+
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+class TripSummary(NamedTuple):
+    """Forecast aggregates the packing rules are evaluated against."""
+
+    avg_high: float
+    avg_low: float
+    total_precip: float
+    rainy_days: int
+    days: int
+
+
+# (predicate, items) pairs; every rule whose predicate holds contributes its items.
+# The jacket and umbrella rules use disjoint ranges, so at most one of each applies.
+_PACK_RULES = (
+    (lambda s: s.avg_high > 25, ("☀️ Sunscreen", "🕶️ Sunglasses", "🧢 Hat")),
+    (lambda s: s.avg_low < 10, ("🧥 Warm jacket", "🧣 Scarf")),
+    (lambda s: 10 <= s.avg_low < 15, ("🧥 Light jacket",)),
+    (lambda s: s.total_precip > 10, ("☂️ Umbrella", "🥾 Waterproof shoes")),
+    (lambda s: 0 < s.total_precip <= 10, ("☂️ Small umbrella (just in case)",)),
+    (lambda s: s.rainy_days > s.days / 2, ("🧥 Rain jacket",)),
+)
+
+
+def packing_list(summary: TripSummary) -> list[str]:
+    """Return the packing recommendations that apply to a trip summary."""
+    return [item for applies, items in _PACK_RULES if applies(summary) for item in items]
+
+
+async def build_trip_report(destination: str, days: int = 7) -> list[str]:
+    """Plan a trip by checking weather and air quality, returning the report lines.
+
+    Nothing is printed, so several reports can be built concurrently and
+    rendered one at a time.
 
     Args:
         destination: Location name (e.g., "Rome, Italy")
         days: Number of days to forecast
     """
+    out: list[str] = []
 
-    print(f"\n{'=' * 80}")
-    print(f"TRIP PLANNER - {destination}")
-    print(f"{'=' * 80}\n")
+    out.append(f"\n{'=' * 80}")
+    out.append(f"TRIP PLANNER - {destination}")
+    out.append(f"{'=' * 80}\n")
 
     # Step 1: Find the location
-    print(f"📍 Finding {destination}...")
-    locations = await geocode_location(name=destination, count=1)
-
-    if not locations.get("results"):
-        print(f"❌ Could not find {destination}")
-        return
-
-    location = locations["results"][0]
-    lat = location["latitude"]
-    lon = location["longitude"]
-
-    print(f"✓ Found: {location['name']}, {location.get('country', 'Unknown')}")
-    print(f"  Coordinates: {lat}, {lon}")
-    print(f"  Timezone: {location.get('timezone', 'Unknown')}")
-    if location.get("elevation"):
-        print(f"  Elevation: {location['elevation']}m")
-    print()
-
-    # Step 2: Get weather forecast
-    print(f"🌤️  Fetching {days}-day weather forecast...")
-    weather = await get_weather_forecast(
-        latitude=lat,
-        longitude=lon,
-        forecast_days=days,
-        current_weather=True,
-        daily="temperature_2m_max,temperature_2m_min,precipitation_sum,precipitation_hours,sunrise,sunset",
+    out.append(f"📍 Finding {destination}...")
+    found = await geocode_first(destination)
+
+    if found is None:
+        out.append(f"❌ Could not find {destination}")
+        return out
+
+    lat, lon, location = found
+
+    out.append(f"✓ Found: {location.name}, {location.country or 'Unknown'}")
+    out.append(f"  Coordinates: {lat}, {lon}")
+    out.append(f"  Timezone: {location.timezone or 'Unknown'}")
+    if location.elevation:
+        out.append(f"  Elevation: {location.elevation}m")
+    out.append("")
+
+    # Step 2: Get weather forecast and air quality concurrently (both only need coordinates)
+    out.append(f"🌤️  Fetching {days}-day weather forecast...")
+    weather, air = await asyncio.gather(
+        get_weather_forecast(
+            latitude=lat,
+            longitude=lon,
+            forecast_days=days,
+            current_weather=True,
+            daily="temperature_2m_max,temperature_2m_min,precipitation_sum,precipitation_hours,sunrise,sunset",
+        ),
+        get_air_quality(latitude=lat, longitude=lon),
     )
 
     # Display current weather
-    if "current_weather" in weather:
-        current = weather["current_weather"]
-        print("\n📊 Current Conditions:")
-        print(f"  Temperature: {current.get('temperature')}°C")
-        print(f"  Wind Speed: {current.get('windspeed')} km/h")
+    if weather.current_weather:
+        current = weather.current_weather
+        out.append("\n📊 Current Conditions:")
+        out.append(f"  Temperature: {current.temperature}°C")
+        out.append(f"  Wind Speed: {current.windspeed} km/h")
 
     # Display forecast
-    if "daily" in weather:
-        daily = weather["daily"]
-        print(f"\n📅 {days}-Day Forecast:\n")
-
-        dates = daily.get("time", [])
-        temp_max = daily.get("temperature_2m_max", [])
-        temp_min = daily.get("temperature_2m_min", [])
-        precip_sum = daily.get("precipitation_sum", [])
-        precip_hours = daily.get("precipitation_hours", [])
-        sunrise = daily.get("sunrise", [])
-        sunset = daily.get("sunset", [])
-
-        for i in range(min(days, len(dates))):
-            date = dates[i]
-            # Parse date
-            try:
-                dt = datetime.fromisoformat(date)
-                day_name = dt.strftime("%A")
-            except (ValueError, TypeError):
-                day_name = "Day"
-
-            print(f"  {day_name}, {date}")
-            print(f"    🌡️  High: {temp_max[i]}°C | Low: {temp_min[i]}°C")
+    if weather.daily:
+        d = daily_columns(weather.daily)
+        out.append(f"\n📅 {days}-Day Forecast:\n")
+
+        # Daily times are always ISO dates, so resolve weekday names in one pass up front
+        day_names = [_DAY_NAMES[datetime.fromisoformat(t).weekday()] for t in d.time[:days]]
+        days_iter = zip(day_names, d.time, d.tmax, d.tmin, d.psum, d.phrs, d.sunrise, d.sunset)
+        for day_name, date, tmax, tmin, psum, phrs, sr, ss in days_iter:
+            out.append(f"  {day_name}, {date}")
+            out.append(f"    🌡️  High: {tmax}°C | Low: {tmin}°C")
 
             # Precipitation analysis
-            if precip_sum[i] > 0:
-                print(f"    🌧️  Precipitation: {precip_sum[i]}mm over {precip_hours[i]}h")
+            if psum > 0:
+                out.append(f"    🌧️  Precipitation: {psum}mm over {phrs}h")
             else:
-                print("    ☀️  No precipitation expected")
+                out.append("    ☀️  No precipitation expected")
 
             # Sunrise/sunset if available
-            if i < len(sunrise) and sunrise[i]:
-                sr_time = sunrise[i].split("T")[1] if "T" in sunrise[i] else sunrise[i]
-                ss_time = sunset[i].split("T")[1] if "T" in sunset[i] else sunset[i]
-                print(f"    🌅 Sunrise: {sr_time} | 🌇 Sunset: {ss_time}")
-            print()
+            if sr:
+                sr_time = sr.split("T")[1] if "T" in sr else sr
+                ss_time = ss.split("T")[1] if "T" in ss else ss
+                out.append(f"    🌅 Sunrise: {sr_time} | 🌇 Sunset: {ss_time}")
+            out.append("")
 
         # Summary statistics
-        avg_high = sum(temp_max) / len(temp_max)
-        avg_low = sum(temp_min) / len(temp_min)
-        total_precip = sum(precip_sum)
-        rainy_days = sum(1 for p in precip_sum if p > 0.1)
+        precip = summarize(d.psum, threshold=RAINY_DAY_MM)
+        avg_high = summarize(d.tmax).mean
+        avg_low = summarize(d.tmin).mean
+        total_precip = precip.total
+        rainy_days = precip.above
 
-        print("📈 Summary:")
-        print(f"  Average High: {avg_high:.1f}°C")
-        print(f"  Average Low: {avg_low:.1f}°C")
-        print(f"  Total Precipitation: {total_precip:.1f}mm")
-        print(f"  Rainy Days: {rainy_days}/{days}")
+        out.append("📈 Summary:")
+        out.append(f"  Average High: {avg_high:.1f}°C")
+        out.append(f"  Average Low: {avg_low:.1f}°C")
+        out.append(f"  Total Precipitation: {total_precip:.1f}mm")
+        out.append(f"  Rainy Days: {rainy_days}/{days}")
 
-    print()
+    out.append("")
 
     # Step 3: Check air quality
-    print("💨 Checking air quality...")
-    air = await get_air_quality(latitude=lat, longitude=lon)
+    out.append("💨 Checking air quality...")
 
-    if "hourly" in air:
-        hourly = air["hourly"]
+    if air.hourly:
+        hourly = air.hourly
 
         # Get current or first available reading
-        if hourly.get("time") and len(hourly["time"]) > 0:
-            print("\n🏭 Air Quality (latest reading):")
-
-            if "us_aqi" in hourly and hourly["us_aqi"] and hourly["us_aqi"][0]:
-                aqi = hourly["us_aqi"][0]
-                print(f"  US AQI: {aqi}")
-
-                # Interpret AQI
-                if aqi <= 50:
-                    status = "Good 😊"
-                    advice = "Air quality is satisfactory"
-                elif aqi <= 100:
-                    status = "Moderate 😐"
-                    advice = "Acceptable for most people"
-                elif aqi <= 150:
-                    status = "Unhealthy for Sensitive Groups 😷"
-                    advice = "Sensitive groups should limit outdoor activity"
-                elif aqi <= 200:
-                    status = "Unhealthy 😨"
-                    advice = "Everyone should reduce prolonged outdoor exertion"
-                else:
-                    status = "Very Unhealthy/Hazardous ⚠️"
-                    advice = "Avoid outdoor activities"
-
-                print(f"  Status: {status}")
-                print(f"  Advice: {advice}")
-
-            if "pm2_5" in hourly and hourly["pm2_5"] and hourly["pm2_5"][0]:
-                print(f"  PM2.5: {hourly['pm2_5'][0]} µg/m³")
-
-            if "pm10" in hourly and hourly["pm10"] and hourly["pm10"][0]:
-                print(f"  PM10: {hourly['pm10'][0]} µg/m³")
-
-    print()
+        if hourly.time:
+            out.append("\n🏭 Air Quality (latest reading):")
 
-    # Step 4: Packing recommendations
-    print("🎒 Packing Recommendations:")
+            if hourly.us_aqi and hourly.us_aqi[0]:
+                aqi = hourly.us_aqi[0]
+                out.append(f"  US AQI: {aqi}")
 
-    recommendations = []
+                status, advice = aqi_label(aqi)
+                out.append(f"  Status: {status}")
+                out.append(f"  Advice: {advice}")
 
-    if avg_high > 25:
-        recommendations.extend(["☀️ Sunscreen", "🕶️ Sunglasses", "🧢 Hat"])
-    if avg_low < 10:
-        recommendations.extend(["🧥 Warm jacket", "🧣 Scarf"])
-    elif avg_low < 15:
-        recommendations.append("🧥 Light jacket")
+            if hourly.pm2_5 and hourly.pm2_5[0]:
+                out.append(f"  PM2.5: {hourly.pm2_5[0]} µg/m³")
 
-    if total_precip > 10:
-        recommendations.extend(["☂️ Umbrella", "🥾 Waterproof shoes"])
-    elif total_precip > 0:
-        recommendations.append("☂️ Small umbrella (just in case)")
+            if hourly.pm10 and hourly.pm10[0]:
+                out.append(f"  PM10: {hourly.pm10[0]} µg/m³")
 
-    if rainy_days > days / 2:
-        recommendations.append("🧥 Rain jacket")
+    out.append("")
+
+    # Step 4: Packing recommendations
+    out.append("🎒 Packing Recommendations:")
+
+    recommendations = packing_list(TripSummary(avg_high, avg_low, total_precip, rainy_days, days))
 
     for rec in recommendations:
-        print(f"  {rec}")
+        out.append(f"  {rec}")
+
+    out.append(f"\n{'=' * 80}")
+    out.append(f"Have a great trip to {destination}! ✈️")
+    out.append(f"{'=' * 80}\n")
+
+    return out
 
-    print(f"\n{'=' * 80}")
-    print(f"Have a great trip to {destination}! ✈️")
-    print(f"{'=' * 80}\n")
+
+async def plan_trip(destination: str, days: int = 7):
+    """Plan a trip by checking weather and air quality, and print the report.
+
+    Args:
+        destination: Location name (e.g., "Rome, Italy")
+        days: Number of days to forecast
+    """
+    emit(await build_trip_report(destination, days))
 
 
 async def main():
     """Run trip planner examples."""
 
-    # Example 1: Rome in spring
-    await plan_trip("Rome, Italy", days=7)
+    # Plan all trips concurrently and print each one as soon as it is ready
+    reports = [build_trip_report(destination, days) for destination, days in TRIPS]
+    for report in asyncio.as_completed(reports):
+        emit(await report)
 
-    # Example 2: Tokyo
-    await plan_trip("Tokyo, Japan", days=5)
 
-    # Example 3: New York
-    await plan_trip("New York, USA", days=7)
+async def run():
+    """Run main() with one pooled HTTP client shared by every tool call."""
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+        timeout=10.0,
+    ) as client:
+        set_shared_client(client)
+        try:
+            return await main()
+        finally:
+            set_shared_client(None)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_main(run())
@@ -6,10 +6,47 @@ and validating the responses according to the MCP specification.
 """
 
 import asyncio
+import io
 import json
 import sys
+import traceback
+from contextvars import ContextVar
 from typing import Any
 
+import orjson
+
+# Stdout buffer size; tool responses such as a full forecast can be tens of KB per line
+STREAM_LIMIT = 1 << 20
+
+INITIALIZE_PARAMS = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "clientInfo": {"name": "test-client", "version": "1.0.0"},
+}
+
+
+def _preview(obj: Any, n: int = 500) -> str:
+    """Pretty-print obj as JSON, truncated to roughly n characters for display."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)[:n].decode("utf-8", "replace")
+
+
+# Per-test output buffer, so concurrently running tests print as whole blocks
+_test_output: ContextVar[io.StringIO | None] = ContextVar("_test_output", default=None)
+
+
+class _TaskLocalStdout:
+    """Stdout proxy that writes to the current test's buffer when one is set."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = _test_output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
 
 class MCPClient:
     """Simple MCP client for testing the server."""
@@ -17,6 +54,24 @@ class MCPClient:
     def __init__(self):
         self.request_id = 0
         self.process = None
+        # Responses are matched to requests by id, so concurrent callers can share the pipe
+        self._pending: dict[int, asyncio.Future] = {}
+        self._reader: asyncio.Task | None = None
+        # Response to the initialize request sent when the session was opened
+        self.initialize_response: dict | None = None
+
+    async def __aenter__(self) -> "MCPClient":
+        """Start the server and initialize a session that lives for the whole block."""
+        await self.start_server()
+        try:
+            self.initialize_response = await self.initialize()
+        except BaseException:
+            await self.stop_server()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop_server()
 
     async def start_server(self):
         """Start the MCP server as a subprocess."""
@@ -28,16 +83,66 @@ class MCPClient:
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT,
         )
+        self._reader = asyncio.create_task(self._dispatch_responses())
         print("✓ Server started")
 
     async def stop_server(self):
         """Stop the MCP server."""
+        if self._reader:
+            self._reader.cancel()
         if self.process:
             self.process.terminate()
             await self.process.wait()
             print("✓ Server stopped")
 
+    async def read_message(self) -> bytes:
+        """Read one newline-terminated message from the server's stdout.
+
+        Messages longer than STREAM_LIMIT are drained in limit-sized pieces
+        instead of failing, so an unusually large response never breaks the run.
+        """
+        chunks = []
+        while True:
+            try:
+                chunks.append(await self.process.stdout.readuntil(b"\n"))
+                return b"".join(chunks)
+            except asyncio.LimitOverrunError as e:
+                chunks.append(await self.process.stdout.readexactly(e.consumed))
+
+    async def _dispatch_responses(self) -> None:
+        """Route each response line to the future of the request with the same id.
+
+        If reading or decoding fails, every pending request is failed with the error
+        instead of being left waiting for a response that will never be routed.
+        """
+        try:
+            while True:
+                response = orjson.loads(await self.read_message())
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            closed = isinstance(e, asyncio.IncompleteReadError)
+            error = ConnectionError("MCP server closed its stdout") if closed else e
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+            if not closed:
+                raise
+
+    def _prepare(self, method: str, params: dict[str, Any] | None) -> tuple[bytes, asyncio.Future]:
+        """Encode a request with the next id and register a future for its response."""
+        self.request_id += 1
+        request = {"jsonrpc": "2.0", "id": self.request_id, "method": method}
+        if params is not None:
+            request["params"] = params
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self.request_id] = future
+        return orjson.dumps(request) + b"\n", future
+
     async def send_request(self, method: str, params: dict[str, Any] = None) -> dict:
         """Send a JSON-RPC request to the server.
 
@@ -48,236 +153,219 @@ class MCPClient:
         Returns:
             The response from the server
         """
-        self.request_id += 1
+        message, future = self._prepare(method, params)
 
-        request = {
-            "jsonrpc": "2.0",
-            "id": self.request_id,
-            "method": method,
-        }
+        # Send request (orjson emits UTF-8 bytes, so no str -> bytes transcode)
+        self.process.stdin.write(message)
+        await self.process.stdin.drain()
 
-        if params is not None:
-            request["params"] = params
+        # The response is delivered by the dispatcher task
+        return await future
 
-        # Send request
-        request_json = json.dumps(request) + "\n"
-        self.process.stdin.write(request_json.encode())
-        await self.process.stdin.drain()
+    async def send_batch(self, calls: list[tuple[str, dict[str, Any] | None]]) -> list[dict]:
+        """Send several JSON-RPC requests in one write and collect their responses.
 
-        # Read response
-        response_line = await self.process.stdout.readline()
-        response = json.loads(response_line.decode())
+        The requests are pipelined as newline-delimited messages (the stdio
+        transport handles one message per line), so the whole batch costs a single
+        write/drain instead of one pipe round-trip per call.
 
-        return response
+        Args:
+            calls: (method, params) pairs; params may be None
+
+        Returns:
+            The responses, in the same order as calls
+        """
+        payload = bytearray()
+        futures = []
+        for method, params in calls:
+            message, future = self._prepare(method, params)
+            payload += message
+            futures.append(future)
+
+        self.process.stdin.write(payload)
+        await self.process.stdin.drain()
+
+        return list(await asyncio.gather(*futures))
 
     async def initialize(self) -> dict:
         """Initialize the MCP session."""
-        return await self.send_request(
-            "initialize",
-            {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "test-client", "version": "1.0.0"},
-            },
-        )
+        return await self.send_request("initialize", INITIALIZE_PARAMS)
 
 
-async def test_initialize():
+async def test_initialize(client: MCPClient):
     """Test MCP server initialization."""
     print("\n" + "=" * 80)
     print("TEST: Server Initialization")
     print("=" * 80)
 
-    client = MCPClient()
-    await client.start_server()
-
-    try:
-        response = await client.initialize()
-
-        print("Request: initialize")
-        print(f"Response: {json.dumps(response, indent=2)}")
+    # The session was initialized once when the shared client started; re-initializing
+    # here would reset it under the tests running concurrently on the same pipe
+    response = client.initialize_response
 
-        # Validate response
-        assert "result" in response, "Response should have 'result'"
-        result = response["result"]
+    print("Request: initialize")
+    print(f"Response: {json.dumps(response, indent=2)}")
 
-        assert "protocolVersion" in result, "Should return protocol version"
-        assert "serverInfo" in result, "Should return server info"
-        assert "capabilities" in result, "Should return capabilities"
+    # Validate response
+    assert response is not None, "Session should have been initialized"
+    assert "result" in response, "Response should have 'result'"
+    result = response["result"]
 
-        print("\n✓ Initialization test passed")
+    assert "protocolVersion" in result, "Should return protocol version"
+    assert "serverInfo" in result, "Should return server info"
+    assert "capabilities" in result, "Should return capabilities"
 
-    finally:
-        await client.stop_server()
+    print("\n✓ Initialization test passed")
 
 
-async def test_list_tools():
+async def test_list_tools(client: MCPClient):
     """Test listing available tools."""
     print("\n" + "=" * 80)
     print("TEST: List Tools")
     print("=" * 80)
 
-    client = MCPClient()
-    await client.start_server()
-
-    try:
-        # Initialize first
-        await client.initialize()
-
-        # List tools
-        response = await client.send_request("tools/list")
+    # List tools
+    response = await client.send_request("tools/list")
 
-        print("Request: tools/list")
-        print(f"Response: {json.dumps(response, indent=2)}")
+    print("Request: tools/list")
+    print(f"Response: {json.dumps(response, indent=2)}")
 
-        # Validate response
-        assert "result" in response, "Response should have 'result'"
-        result = response["result"]
+    # Validate response
+    assert "result" in response, "Response should have 'result'"
+    result = response["result"]
 
-        assert "tools" in result, "Should return tools list"
-        tools = result["tools"]
+    assert "tools" in result, "Should return tools list"
+    tools = result["tools"]
 
-        assert len(tools) >= 5, "Should have at least 5 tools"
+    assert len(tools) >= 5, "Should have at least 5 tools"
 
-        # Check for expected tools
-        tool_names = [tool["name"] for tool in tools]
-        expected_tools = [
-            "get_weather_forecast",
-            "geocode_location",
-            "get_historical_weather",
-            "get_air_quality",
-            "get_marine_forecast",
-        ]
+    # Check for expected tools
+    tool_names = [tool["name"] for tool in tools]
+    expected_tools = [
+        "get_weather_forecast",
+        "geocode_location",
+        "get_historical_weather",
+        "get_air_quality",
+        "get_marine_forecast",
+    ]
 
-        for expected in expected_tools:
-            assert expected in tool_names, f"Should have {expected} tool"
+    for expected in expected_tools:
+        assert expected in tool_names, f"Should have {expected} tool"
 
-        print(f"\n✓ Found {len(tools)} tools")
-        for tool in tools:
-            print(f"  - {tool['name']}: {tool.get('description', 'No description')[:60]}...")
+    print(f"\n✓ Found {len(tools)} tools")
+    for tool in tools:
+        print(f"  - {tool['name']}: {tool.get('description', 'No description')[:60]}...")
 
-        print("\n✓ List tools test passed")
+    print("\n✓ List tools test passed")
 
-    finally:
-        await client.stop_server()
 
-
-async def test_call_weather_forecast():
+async def test_call_weather_forecast(client: MCPClient):
     """Test calling the weather forecast tool."""
     print("\n" + "=" * 80)
     print("TEST: Call Weather Forecast Tool")
     print("=" * 80)
 
-    client = MCPClient()
-    await client.start_server()
+    # Call weather forecast for London
+    response = await client.send_request(
+        "tools/call",
+        {
+            "name": "get_weather_forecast",
+            "arguments": {"latitude": 51.5072, "longitude": -0.1276, "current_weather": True},
+        },
+    )
 
-    try:
-        # Initialize
-        await client.initialize()
-
-        # Call weather forecast for London
-        response = await client.send_request(
-            "tools/call",
-            {
-                "name": "get_weather_forecast",
-                "arguments": {"latitude": 51.5072, "longitude": -0.1276, "current_weather": True},
-            },
-        )
-
-        print("Request: tools/call - get_weather_forecast")
-        print("Arguments: London (51.5072, -0.1276)")
+    print("Request: tools/call - get_weather_forecast")
+    print("Arguments: London (51.5072, -0.1276)")
 
-        # Validate response
-        assert "result" in response, "Response should have 'result'"
-        result = response["result"]
+    # Validate response
+    assert "result" in response, "Response should have 'result'"
+    result = response["result"]
 
-        # The result should contain the weather data
-        assert "content" in result or "latitude" in result, "Should return weather data"
+    # The result should contain the weather data
+    assert "content" in result or "latitude" in result, "Should return weather data"
 
-        print(f"Response preview: {json.dumps(result, indent=2)[:500]}...")
-        print("\n✓ Weather forecast tool test passed")
+    print(f"Response preview: {_preview(result)}...")
+    print("\n✓ Weather forecast tool test passed")
 
-    finally:
-        await client.stop_server()
 
-
-async def test_call_geocode():
+async def test_call_geocode(client: MCPClient):
     """Test calling the geocode tool."""
     print("\n" + "=" * 80)
     print("TEST: Call Geocode Location Tool")
     print("=" * 80)
 
-    client = MCPClient()
-    await client.start_server()
+    # Call geocode
+    response = await client.send_request(
+        "tools/call", {"name": "geocode_location", "arguments": {"name": "Paris", "count": 3}}
+    )
 
-    try:
-        # Initialize
-        await client.initialize()
+    print("Request: tools/call - geocode_location")
+    print("Arguments: name='Paris', count=3")
 
-        # Call geocode
-        response = await client.send_request(
-            "tools/call", {"name": "geocode_location", "arguments": {"name": "Paris", "count": 3}}
-        )
-
-        print("Request: tools/call - geocode_location")
-        print("Arguments: name='Paris', count=3")
+    # Validate response
+    assert "result" in response, "Response should have 'result'"
+    result = response["result"]
 
-        # Validate response
-        assert "result" in response, "Response should have 'result'"
-        result = response["result"]
+    print(f"Response preview: {_preview(result)}...")
+    print("\n✓ Geocode tool test passed")
 
-        print(f"Response preview: {json.dumps(result, indent=2)[:500]}...")
-        print("\n✓ Geocode tool test passed")
-
-    finally:
-        await client.stop_server()
 
-
-async def test_error_handling():
+async def test_error_handling(client: MCPClient):
     """Test error handling with invalid requests."""
     print("\n" + "=" * 80)
     print("TEST: Error Handling")
     print("=" * 80)
 
-    client = MCPClient()
-    await client.start_server()
+    # Send both bad calls in one round-trip
+    unknown_tool, bad_arguments = await client.send_batch(
+        [
+            ("tools/call", {"name": "non_existent_tool", "arguments": {}}),
+            (
+                "tools/call",
+                {
+                    "name": "get_weather_forecast",
+                    "arguments": {
+                        # Missing required latitude/longitude
+                        "current_weather": True
+                    },
+                },
+            ),
+        ]
+    )
 
-    try:
-        # Initialize
-        await client.initialize()
+    # Test 1: Call non-existent tool
+    print("\nTest 1: Non-existent tool")
+    response = unknown_tool
 
-        # Test 1: Call non-existent tool
-        print("\nTest 1: Non-existent tool")
-        response = await client.send_request(
-            "tools/call", {"name": "non_existent_tool", "arguments": {}}
-        )
+    assert "error" in response, "Should return error for non-existent tool"
+    print(f"✓ Correctly returned error: {response['error'].get('message')}")
 
-        assert "error" in response, "Should return error for non-existent tool"
-        print(f"✓ Correctly returned error: {response['error'].get('message')}")
+    # Test 2: Call with invalid arguments
+    print("\nTest 2: Invalid arguments")
+    response = bad_arguments
 
-        # Test 2: Call with invalid arguments
-        print("\nTest 2: Invalid arguments")
-        response = await client.send_request(
-            "tools/call",
-            {
-                "name": "get_weather_forecast",
-                "arguments": {
-                    # Missing required latitude/longitude
-                    "current_weather": True
-                },
-            },
-        )
+    # Should either error or handle gracefully
+    if "error" in response:
+        print(f"✓ Correctly returned error: {response['error'].get('message')}")
+    else:
+        print("✓ Handled invalid arguments gracefully")
 
-        # Should either error or handle gracefully
-        if "error" in response:
-            print(f"✓ Correctly returned error: {response['error'].get('message')}")
-        else:
-            print("✓ Handled invalid arguments gracefully")
+    print("\n✓ Error handling test passed")
 
-        print("\n✓ Error handling test passed")
 
+async def _run_test(name: str, test_func, client: MCPClient) -> bool:
+    """Run one test, buffering its output and printing it as a block when done."""
+    buffer = io.StringIO()
+    _test_output.set(buffer)
+    try:
+        await test_func(client)
+        return True
+    except Exception as e:
+        print(f"\n❌ Test '{name}' failed: {e}")
+        traceback.print_exc(file=sys.stdout)
+        return False
     finally:
-        await client.stop_server()
+        _test_output.set(None)
+        sys.stdout.write(buffer.getvalue())
 
 
 async def main():
@@ -295,19 +383,21 @@ async def main():
         ("Error Handling", test_error_handling),
     ]
 
-    passed = 0
-    failed = 0
-
-    for name, test_func in tests:
-        try:
-            await test_func()
-            passed += 1
-        except Exception as e:
-            print(f"\n❌ Test '{name}' failed: {e}")
-            import traceback
+    # One server and session for the whole run; spawning and importing the server
+    # costs far more than the RPCs themselves
+    stdout = sys.stdout
+    try:
+        async with MCPClient() as client:
+            sys.stdout = _TaskLocalStdout(stdout)
+            # The tests are independent, so run their RPCs concurrently over the shared pipe
+            results = await asyncio.gather(
+                *(_run_test(name, test_func, client) for name, test_func in tests)
+            )
+    finally:
+        sys.stdout = stdout
 
-            traceback.print_exc()
-            failed += 1
+    passed = sum(results)
+    failed = len(tests) - passed
 
     # Summary
     print("\n" + "=" * 80)
@@ -325,5 +415,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # uvloop speeds up the subprocess pipe I/O this client is bound by; it is optional
+    try:
+        import uvloop
+    except ImportError:
+        exit_code = asyncio.run(main())
+    else:
+        exit_code = uvloop.run(main())
     sys.exit(exit_code)
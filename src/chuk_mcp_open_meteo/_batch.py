@@ -2,10 +2,12 @@
 
 from typing import Any, TypeVar
 
-import httpx
-from pydantic import BaseModel
+import orjson
 
-T = TypeVar("T", bound=BaseModel)
+from ._http import http_client
+from .models import ApiResponse
+
+T = TypeVar("T", bound=ApiResponse)
 
 
 async def batch_fetch(
@@ -18,24 +20,25 @@ async def batch_fetch(
 
     Open-Meteo APIs accept comma-separated latitude/longitude values and return
     either a JSON array (multiple locations) or a single object (one location).
-    This helper handles both cases and wraps each result in the given Pydantic model.
+    This helper handles both cases and builds each result with ``item_model.from_raw``,
+    skipping validation of the trusted payload.
 
     Args:
         api_url: The Open-Meteo API endpoint URL.
         params: Query parameters dict (must include 'latitude' and 'longitude'
                 as comma-separated strings).
-        item_model: The Pydantic model class to wrap each result in.
+        item_model: The response model class to build each result with.
         timeout: HTTP request timeout in seconds.
 
     Returns:
         List of item_model instances, one per location.
     """
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         response = await client.get(api_url, params=params, timeout=timeout)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
     if isinstance(data, list):
-        return [item_model(**item) for item in data]
+        return [item_model.from_raw(item) for item in data]
     else:
-        return [item_model(**data)]
+        return [item_model.from_raw(data)]
@@ -0,0 +1,102 @@
+"""In-process TTL cache and request coalescing for Open-Meteo API responses."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import date, timedelta
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Time-to-live per kind of data, in seconds
+FORECAST_TTL = 300.0
+AIR_QUALITY_TTL = 600.0
+MARINE_TTL = 600.0
+HISTORICAL_TTL = 86400.0 * 30  # Settled past date ranges never change
+GEOCODING_TTL = 3600.0  # Place names and coordinates rarely change
+
+# The archive API lags by several days and returns provisional or null values for that
+# window, so only ranges ending before it are considered settled
+ARCHIVE_SETTLE_DAYS = 7
+
+# Most entries kept before the least recently used one is evicted
+DEFAULT_MAX_ENTRIES = 1024
+
+# Coordinates closer than this many decimal places (~11 m) share a cache entry
+_COORD_PRECISION = 4
+
+
+class TTLCache:
+    """A small LRU cache whose entries also expire after a per-entry TTL."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting the least recently used if full."""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+
+# Shared by all tools. Cached models are returned as-is; response models are frozen.
+response_cache = TTLCache()
+
+
+def cache_key(api_url: str, params: dict[str, Any]) -> tuple[Any, ...]:
+    """Build a hashable cache key from an endpoint URL and its query parameters."""
+    normalized = {
+        k: round(v, _COORD_PRECISION) if k in ("latitude", "longitude") else v
+        for k, v in params.items()
+    }
+    return (api_url, tuple(sorted(normalized.items())))
+
+
+# Requests currently on the wire, by cache key
+_inflight: dict[Hashable, "asyncio.Task[Any]"] = {}
+
+
+async def single_flight(key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+    """Run fetch() once for all concurrent callers with the same key.
+
+    The first caller starts the request; callers arriving before it finishes await the
+    same task instead of issuing a duplicate. A cancelled caller does not cancel the
+    request for the others.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+def historical_ttl(end_date: str) -> float:
+    """TTL for an archive query: long for settled past ranges, short for recent ones."""
+    try:
+        settled = date.fromisoformat(end_date) < date.today() - timedelta(ARCHIVE_SETTLE_DAYS)
+    except ValueError:
+        settled = False
+    return HISTORICAL_TTL if settled else FORECAST_TTL
@@ -1,5 +1,7 @@
 """Shared constants for the Open-Meteo MCP server."""
 
+from typing import Optional
+
 # API endpoints
 FORECAST_API = "https://api.open-meteo.com/v1/forecast"
 GEOCODING_API = "https://geocoding-api.open-meteo.com/v1/search"
@@ -16,37 +18,45 @@ DEFAULT_MARINE_HOURLY = (
 )
 
 # WMO Weather Interpretation Codes (used by Open-Meteo)
-WEATHER_CODES: dict[int, dict[str, str]] = {
-    0: {"description": "Clear sky", "severity": "clear"},
-    1: {"description": "Mainly clear", "severity": "clear"},
-    2: {"description": "Partly cloudy", "severity": "cloudy"},
-    3: {"description": "Overcast", "severity": "cloudy"},
-    45: {"description": "Fog", "severity": "fog"},
-    48: {"description": "Depositing rime fog", "severity": "fog"},
-    51: {"description": "Light drizzle", "severity": "drizzle"},
-    53: {"description": "Moderate drizzle", "severity": "drizzle"},
-    55: {"description": "Dense drizzle", "severity": "drizzle"},
-    56: {"description": "Light freezing drizzle", "severity": "freezing"},
-    57: {"description": "Dense freezing drizzle", "severity": "freezing"},
-    61: {"description": "Slight rain", "severity": "rain"},
-    63: {"description": "Moderate rain", "severity": "rain"},
-    65: {"description": "Heavy rain", "severity": "rain"},
-    66: {"description": "Light freezing rain", "severity": "freezing"},
-    67: {"description": "Heavy freezing rain", "severity": "freezing"},
-    71: {"description": "Slight snow fall", "severity": "snow"},
-    73: {"description": "Moderate snow fall", "severity": "snow"},
-    75: {"description": "Heavy snow fall", "severity": "snow"},
-    77: {"description": "Snow grains", "severity": "snow"},
-    80: {"description": "Slight rain showers", "severity": "showers"},
-    81: {"description": "Moderate rain showers", "severity": "showers"},
-    82: {"description": "Violent rain showers", "severity": "showers"},
-    85: {"description": "Slight snow showers", "severity": "snow"},
-    86: {"description": "Heavy snow showers", "severity": "snow"},
-    95: {"description": "Thunderstorm", "severity": "thunderstorm"},
-    96: {"description": "Thunderstorm with slight hail", "severity": "thunderstorm"},
-    99: {"description": "Thunderstorm with heavy hail", "severity": "thunderstorm"},
+# code -> (description, severity)
+WEATHER_CODES: dict[int, tuple[str, str]] = {
+    0: ("Clear sky", "clear"),
+    1: ("Mainly clear", "clear"),
+    2: ("Partly cloudy", "cloudy"),
+    3: ("Overcast", "cloudy"),
+    45: ("Fog", "fog"),
+    48: ("Depositing rime fog", "fog"),
+    51: ("Light drizzle", "drizzle"),
+    53: ("Moderate drizzle", "drizzle"),
+    55: ("Dense drizzle", "drizzle"),
+    56: ("Light freezing drizzle", "freezing"),
+    57: ("Dense freezing drizzle", "freezing"),
+    61: ("Slight rain", "rain"),
+    63: ("Moderate rain", "rain"),
+    65: ("Heavy rain", "rain"),
+    66: ("Light freezing rain", "freezing"),
+    67: ("Heavy freezing rain", "freezing"),
+    71: ("Slight snow fall", "snow"),
+    73: ("Moderate snow fall", "snow"),
+    75: ("Heavy snow fall", "snow"),
+    77: ("Snow grains", "snow"),
+    80: ("Slight rain showers", "showers"),
+    81: ("Moderate rain showers", "showers"),
+    82: ("Violent rain showers", "showers"),
+    85: ("Slight snow showers", "snow"),
+    86: ("Heavy snow showers", "snow"),
+    95: ("Thunderstorm", "thunderstorm"),
+    96: ("Thunderstorm with slight hail", "thunderstorm"),
+    99: ("Thunderstorm with heavy hail", "thunderstorm"),
 }
 
+# WMO codes span 0-99. A dense table indexed by code replaces the dict membership test
+# and hash lookup; gaps (undefined codes) hold None.
+WMO_CODE_COUNT = 100
+WMO_CODES: tuple[Optional[tuple[str, str]], ...] = tuple(
+    WEATHER_CODES.get(code) for code in range(WMO_CODE_COUNT)
+)
+
 # OpenWeatherMap icon CDN — maps severity categories to representative icon codes.
 # Use @2x for high-DPI markers on maps.  "d" = day variant (always legible).
 _OWM_CDN = "https://openweathermap.org/img/wn"
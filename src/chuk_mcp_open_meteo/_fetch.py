@@ -0,0 +1,49 @@
+"""Cached, coalesced fetch helper for single-location Open-Meteo requests."""
+
+from typing import Any, TypeVar
+
+import orjson
+
+from ._cache import cache_key, response_cache, single_flight
+from ._http import http_client
+from .models import ApiResponse
+
+T = TypeVar("T", bound=ApiResponse)
+
+
+async def fetch_cached(
+    api_url: str,
+    params: dict[str, Any],
+    model: type[T],
+    ttl: float,
+) -> T:
+    """Fetch one Open-Meteo response, served from the response cache when possible.
+
+    On a cache miss, concurrent calls with the same endpoint and parameters share a
+    single HTTP request; the built model is cached for ``ttl`` seconds.
+
+    Args:
+        api_url: The Open-Meteo API endpoint URL.
+        params: Query parameters dict.
+        model: The response model class to build the result with.
+        ttl: How long to cache the result, in seconds.
+
+    Returns:
+        A model instance, shared with other callers of the same request.
+    """
+    key = cache_key(api_url, params)
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async def _fetch() -> T:
+        async with http_client() as client:
+            response = await client.get(api_url, params=params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+        result = model.from_raw(data)
+        response_cache.set(key, result, ttl)
+        return result
+
+    return await single_flight(key, _fetch)
@@ -0,0 +1,87 @@
+"""Shared HTTP client handling for Open-Meteo API calls."""
+
+import asyncio
+import importlib.util
+import ssl
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache
+from typing import Optional
+
+import httpx
+
+# Connection pool size for the default client; batch geocoding fans out concurrently.
+# Idle connections are kept for a minute so bursts of tool calls reuse them.
+_DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0
+)
+
+# Applied to every request on the default client; a shared client keeps its own timeout.
+_DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# HTTP/2 multiplexes concurrent requests to a host over one connection. It needs the
+# optional h2 package (pip install "httpx[http2]"), so it is only enabled when present.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+# Lazily created pooled client used when no shared client is registered. Its connections
+# belong to the event loop that created it, so it is rebuilt if a different loop asks.
+_default_client: Optional[httpx.AsyncClient] = None
+_default_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def set_shared_client(client: Optional[httpx.AsyncClient]) -> None:
+    """Register an httpx.AsyncClient to be reused by all tool calls.
+
+    The caller owns the client's lifecycle (e.g. ``async with httpx.AsyncClient()``)
+    and should pass None to unregister it before closing. While a shared client is
+    set, tools use it instead of the module's default connection pool, along with
+    its timeout settings.
+
+    Args:
+        client: The client to share, or None to go back to the default client.
+    """
+    global _shared_client
+    _shared_client = client
+
+
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    """Build the TLS context once per process.
+
+    Loading the CA bundle is most of the cost of constructing an httpx client, so every
+    client created here shares one context. It is built on first use rather than at
+    import to keep STDIO startup fast.
+    """
+    return httpx.create_ssl_context()
+
+
+def _get_default_client() -> httpx.AsyncClient:
+    """Return the module's pooled client for the running event loop, creating it if needed."""
+    global _default_client, _default_client_loop
+    loop = asyncio.get_running_loop()
+    if _default_client is None or _default_client.is_closed or _default_client_loop is not loop:
+        _default_client = httpx.AsyncClient(
+            limits=_DEFAULT_LIMITS, timeout=_DEFAULT_TIMEOUT, verify=_ssl_context(), http2=_HTTP2
+        )
+        _default_client_loop = loop
+    return _default_client
+
+
+async def aclose_default_client() -> None:
+    """Close the default client, if one was created. The next tool call opens a new one."""
+    global _default_client, _default_client_loop
+    client, _default_client, _default_client_loop = _default_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client if one is registered, otherwise the default pooled client.
+
+    Connections are kept alive between tool calls, so repeated requests to the same
+    Open-Meteo host skip the TCP and TLS handshakes.
+    """
+    yield _shared_client if _shared_client is not None else _get_default_client()
@@ -0,0 +1,33 @@
+"""Cheap argument checks that reject bad tool input before any HTTP request is made."""
+
+from datetime import date
+
+MAX_FORECAST_DAYS = 16
+
+
+def check_coordinates(latitude: float, longitude: float) -> None:
+    """Raise ValueError if the coordinates are outside the valid ranges."""
+    if not -90.0 <= latitude <= 90.0:
+        raise ValueError(f"latitude must be between -90 and 90, got {latitude}")
+    if not -180.0 <= longitude <= 180.0:
+        raise ValueError(f"longitude must be between -180 and 180, got {longitude}")
+
+
+def check_forecast_days(forecast_days: int) -> None:
+    """Raise ValueError if forecast_days is outside 1-16."""
+    if not 1 <= forecast_days <= MAX_FORECAST_DAYS:
+        raise ValueError(
+            f"forecast_days must be between 1 and {MAX_FORECAST_DAYS}, got {forecast_days}"
+        )
+
+
+def check_date_range(start_date: str, end_date: str) -> None:
+    """Raise ValueError unless both dates are ISO (YYYY-MM-DD) and start is not after end."""
+    try:
+        start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    except ValueError:
+        raise ValueError(
+            f"start_date and end_date must be YYYY-MM-DD, got {start_date!r} and {end_date!r}"
+        ) from None
+    if start > end:
+        raise ValueError(f"start_date {start_date} is after end_date {end_date}")
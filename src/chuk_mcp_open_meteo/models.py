@@ -1,12 +1,149 @@
 """Pydantic models for Open-Meteo API responses.
 
 All API responses are properly typed using Pydantic models for type safety,
-validation, and better IDE support.
+validation, and better IDE support. Per-field documentation lives in
+``models_descriptions.py`` and is merged into JSON schemas on demand.
 """
 
-from typing import Optional
+import math
+from array import array
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timezone
+from itertools import repeat
+from typing import Any, ClassVar, Optional, Self
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+
+from ._constants import WMO_CODE_COUNT, WMO_CODES
+
+# Shared stand-in for columns the API did not return
+_EMPTY_COLUMN: tuple[Any, ...] = ()
+
+
+# Base Models
+class ApiResponse(BaseModel):
+    """Base for top-level API responses that can be built from a parsed JSON payload.
+
+    Responses are frozen: cached instances are shared between callers, so they must not
+    be modified in place.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    # Field name -> model for nested objects (or lists of objects) in the payload
+    _nested: ClassVar[dict[str, type[BaseModel]]] = {}
+
+    @classmethod
+    def from_raw(cls, data: dict[str, Any], strict: bool = False) -> Self:
+        """Build the model from a decoded Open-Meteo payload.
+
+        Open-Meteo responses are trusted, so by default the model and its nested
+        submodels are assembled with ``model_construct``, skipping per-element
+        validation of the (often thousands long) hourly columns.
+
+        Args:
+            data: Payload as returned by ``orjson.loads``
+            strict: Run full Pydantic validation instead, e.g. in tests
+
+        Example:
+            forecast = WeatherForecast.from_raw(orjson.loads(response.content))
+        """
+        if strict:
+            return cls.model_validate(data)
+        values = dict(data)
+        for name, model in cls._nested.items():
+            value = values.get(name)
+            if isinstance(value, dict):
+                values[name] = model.model_construct(**value)
+            elif isinstance(value, list):
+                values[name] = [model.model_construct(**item) for item in value]
+        return cls.model_construct(**values)
+
+
+class TimeSeries(BaseModel):
+    """Base for hourly/daily blocks whose fields are parallel per-timestep columns."""
+
+    model_config = ConfigDict(frozen=True)
+
+    time: list[str]
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Return a column's values, or a shared empty sequence if it was not requested.
+
+        Example:
+            total_rain = sum(forecast.daily.column("precipitation_sum"))
+        """
+        return getattr(self, name) or _EMPTY_COLUMN
+
+    def as_array(self, name: str, typecode: str = "d") -> array:
+        """Return a numeric column as a packed float array, with missing values as NaN.
+
+        A packed array stores 8 bytes per value instead of one boxed float object per
+        element, which keeps long series (e.g. a year of hourly data) compact for
+        aggregation. Returns an empty array if the column was not requested.
+
+        Args:
+            name: Field name of the column, e.g. "temperature_2m"
+            typecode: "d" for float64 (default) or "f" for float32, which halves memory
+                and is ample precision for weather measurements
+
+        Example:
+            temps = forecast.hourly.as_array("temperature_2m", "f")
+            peak = max(temps)
+        """
+        if typecode not in ("d", "f"):
+            raise ValueError(f"typecode must be 'd' or 'f', got {typecode!r}")
+        values = self.column(name)
+        try:
+            # Gap-free columns (the common case) are packed in one C-level pass
+            return array(typecode, values)
+        except TypeError:
+            return array(typecode, [math.nan if v is None else v for v in values])
+
+    def rows(self, *names: str) -> Iterator[tuple]:
+        """Iterate per-timestep records of (time, *values) across several columns.
+
+        Columns are walked in lockstep in one pass, which suits cross-field filters
+        such as "hours where wave height > 2 m and wave period > 10 s". A column
+        that was not requested yields None for every timestep.
+
+        Example:
+            big_swell = [
+                t for t, height, period in marine.hourly.rows("wave_height", "wave_period")
+                if height and period and height > 2 and period > 10
+            ]
+        """
+        n = len(self.time)
+        columns = [getattr(self, name) or repeat(None, n) for name in names]
+        return zip(self.time, *columns)
+
+    def epoch_seconds(self) -> array:
+        """Return the time column as a packed int64 array of seconds since the epoch.
+
+        Open-Meteo timestamps are wall-clock times in the requested timezone with no
+        offset, so they are read as if they were UTC; differences between entries are
+        exact. The time axis is a uniform grid, so when the first step and the span
+        agree the column is generated from (start, step, count) without parsing every
+        timestamp.
+
+        Example:
+            seconds = forecast.hourly.epoch_seconds()
+            hours_ahead = (seconds[-1] - seconds[0]) // 3600
+        """
+        times = self.time
+        n = len(times)
+        if n < 3:
+            return array("q", map(_epoch_seconds, times))
+        start = _epoch_seconds(times[0])
+        step = _epoch_seconds(times[1]) - start
+        if step > 0 and _epoch_seconds(times[-1]) == start + step * (n - 1):
+            return array("q", range(start, start + step * n, step))
+        return array("q", map(_epoch_seconds, times))
+
+
+def _epoch_seconds(timestamp: str) -> int:
+    """Seconds since the epoch for an offset-less ISO-8601 date or datetime, read as UTC."""
+    return int(datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc).timestamp())
 
 
 # Weather Forecast Models
@@ -16,26 +153,23 @@ class CurrentWeather(BaseModel):
     Use weathercode with interpret_weather_code tool for human-readable description.
     """
 
-    temperature: float = Field(
-        ..., description="Current temperature in requested unit (celsius or fahrenheit)"
-    )
-    windspeed: float = Field(
-        ..., description="Current wind speed in requested unit (km/h, m/s, mph, or knots)"
-    )
-    winddirection: float = Field(
-        ...,
-        description="Wind direction in degrees (0-360, meteorological: 0=from North, 90=from East, "
-        "180=from South, 270=from West)",
-    )
-    weathercode: int = Field(
-        ...,
-        description="WMO weather code (0-99). Use interpret_weather_code tool to get description. "
-        "Common: 0=clear, 1-3=cloudy, 45/48=fog, 51-67=rain/drizzle, 71-77=snow, 95-99=thunderstorm",
-    )
-    time: str = Field(..., description="ISO 8601 timestamp of current conditions")
-
-
-class HourlyWeather(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    temperature: float
+    windspeed: float
+    winddirection: float
+    weathercode: int
+    time: str
+
+    @property
+    def weathercode_text(self) -> str:
+        """Human-readable description of weathercode, e.g. "Partly cloudy"."""
+        code = self.weathercode
+        known = WMO_CODES[code] if 0 <= code < WMO_CODE_COUNT else None
+        return known[0] if known is not None else f"Unknown weather code: {code}"
+
+
+class HourlyWeather(TimeSeries):
     """Hourly weather forecast data with 50+ available variables.
 
     All lists are parallel arrays - use the same index across all fields for a specific hour.
@@ -44,39 +178,22 @@ class HourlyWeather(BaseModel):
 
     model_config = ConfigDict(extra="allow")  # Allow additional fields from API
 
-    time: list[str] = Field(..., description="ISO 8601 timestamps for each hour")
-    temperature_2m: Optional[list[float]] = Field(
-        None, description="Temperature at 2 meters height in requested unit"
-    )
-    relative_humidity_2m: Optional[list[float]] = Field(
-        None, description="Relative humidity at 2 meters (0-100%)"
-    )
-    precipitation: Optional[list[float]] = Field(
-        None,
-        description="Total precipitation (rain + snow + showers) in requested unit (mm or inch). "
-        "0=no precipitation",
-    )
-    rain: Optional[list[float]] = Field(
-        None, description="Rain amount only (excluding snow/showers)"
-    )
-    showers: Optional[list[float]] = Field(None, description="Shower precipitation amount")
-    snowfall: Optional[list[float]] = Field(None, description="Snowfall amount in cm or inch")
-    cloud_cover: Optional[list[float]] = Field(
-        None, description="Total cloud cover percentage (0-100%). 0=clear, 100=overcast"
-    )
-    wind_speed_10m: Optional[list[float]] = Field(
-        None, description="Wind speed at 10 meters height in requested unit"
-    )
-    wind_direction_10m: Optional[list[float]] = Field(
-        None,
-        description="Wind direction at 10m in degrees (0-360, from North=0, East=90, South=180, West=270)",
-    )
-    pressure_msl: Optional[list[float]] = Field(
-        None, description="Atmospheric pressure at sea level in hPa"
-    )
-
-
-class DailyWeather(BaseModel):
+    time: list[str]
+    temperature_2m: Optional[list[float]] = None
+    relative_humidity_2m: Optional[list[float]] = None
+    precipitation: Optional[list[float]] = None
+    rain: Optional[list[float]] = None
+    showers: Optional[list[float]] = None
+    snowfall: Optional[list[float]] = None
+    cloud_cover: Optional[list[float]] = None
+    wind_speed_10m: Optional[list[float]] = None
+    wind_direction_10m: Optional[list[float]] = None
+    pressure_msl: Optional[list[float]] = None
+    visibility: Optional[list[float]] = None
+    uv_index: Optional[list[float]] = None
+
+
+class DailyWeather(TimeSeries):
     """Daily weather forecast summary data.
 
     Provides daily aggregates - high/low temps, totals, and key times.
@@ -85,116 +202,125 @@ class DailyWeather(BaseModel):
 
     model_config = ConfigDict(extra="allow")  # Allow additional fields from API
 
-    time: list[str] = Field(..., description="ISO 8601 dates (YYYY-MM-DD format)")
-    temperature_2m_max: Optional[list[float]] = Field(
-        None, description="Maximum (high) temperature for the day in requested unit"
-    )
-    temperature_2m_min: Optional[list[float]] = Field(
-        None, description="Minimum (low) temperature for the day in requested unit"
-    )
-    precipitation_sum: Optional[list[float]] = Field(
-        None,
-        description="Total precipitation for the day (rain + snow) in requested unit (mm or inch)",
-    )
-    precipitation_hours: Optional[list[float]] = Field(
-        None, description="Number of hours with precipitation during the day (0-24)"
-    )
-    rain_sum: Optional[list[float]] = Field(
-        None, description="Total rain for the day (excluding snow)"
-    )
-    sunrise: Optional[list[str]] = Field(None, description="Sunrise time in ISO 8601 format")
-    sunset: Optional[list[str]] = Field(None, description="Sunset time in ISO 8601 format")
-    wind_speed_10m_max: Optional[list[float]] = Field(
-        None, description="Maximum wind speed during the day in requested unit"
-    )
-
-
-class WeatherForecast(BaseModel):
+    time: list[str]
+    temperature_2m_max: Optional[list[float]] = None
+    temperature_2m_min: Optional[list[float]] = None
+    precipitation_sum: Optional[list[float]] = None
+    precipitation_hours: Optional[list[float]] = None
+    rain_sum: Optional[list[float]] = None
+    sunrise: Optional[list[str]] = None
+    sunset: Optional[list[str]] = None
+    wind_speed_10m_max: Optional[list[float]] = None
+
+
+class WeatherForecast(ApiResponse):
     """Complete weather forecast response."""
 
-    latitude: float = Field(..., description="Latitude of the location")
-    longitude: float = Field(..., description="Longitude of the location")
-    elevation: Optional[float] = Field(None, description="Elevation in meters")
-    timezone: Optional[str] = Field(None, description="Timezone name")
-    timezone_abbreviation: Optional[str] = Field(None, description="Timezone abbreviation")
-    current_weather: Optional[CurrentWeather] = Field(None, description="Current weather")
-    hourly: Optional[HourlyWeather] = Field(None, description="Hourly forecast")
-    daily: Optional[DailyWeather] = Field(None, description="Daily forecast")
+    _nested = {
+        "current_weather": CurrentWeather,
+        "hourly": HourlyWeather,
+        "daily": DailyWeather,
+    }
+
+    latitude: float
+    longitude: float
+    elevation: Optional[float] = None
+    timezone: Optional[str] = None
+    timezone_abbreviation: Optional[str] = None
+    current_weather: Optional[CurrentWeather] = None
+    hourly: Optional[HourlyWeather] = None
+    daily: Optional[DailyWeather] = None
 
 
 # Geocoding Models
 class GeocodingResult(BaseModel):
     """Single location result from geocoding."""
 
-    id: Optional[int] = Field(None, description="Location ID")
-    name: str = Field(..., description="Location name")
-    latitude: float = Field(..., description="Latitude")
-    longitude: float = Field(..., description="Longitude")
-    elevation: Optional[float] = Field(None, description="Elevation in meters")
-    feature_code: Optional[str] = Field(None, description="GeoNames feature code")
-    country_code: Optional[str] = Field(None, description="ISO 3166-1 alpha-2 country code")
-    country: Optional[str] = Field(None, description="Country name")
-    country_id: Optional[int] = Field(None, description="Country ID")
-    timezone: Optional[str] = Field(None, description="Timezone name")
-    population: Optional[int] = Field(None, description="Population")
-    postcodes: Optional[list[str]] = Field(None, description="Postcodes")
-    admin1: Optional[str] = Field(None, description="Administrative division level 1")
-    admin2: Optional[str] = Field(None, description="Administrative division level 2")
-    admin3: Optional[str] = Field(None, description="Administrative division level 3")
-    admin4: Optional[str] = Field(None, description="Administrative division level 4")
-
-
-class GeocodingResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[int] = None
+    name: str
+    latitude: float
+    longitude: float
+    elevation: Optional[float] = None
+    feature_code: Optional[str] = None
+    country_code: Optional[str] = None
+    country: Optional[str] = None
+    country_id: Optional[int] = None
+    timezone: Optional[str] = None
+    population: Optional[int] = None
+    postcodes: Optional[list[str]] = None
+    admin1: Optional[str] = None
+    admin2: Optional[str] = None
+    admin3: Optional[str] = None
+    admin4: Optional[str] = None
+
+
+class GeocodingResponse(ApiResponse):
     """Geocoding API response."""
 
-    results: Optional[list[GeocodingResult]] = Field(None, description="List of matching locations")
-    generationtime_ms: Optional[float] = Field(None, description="Generation time in ms")
+    _nested = {"results": GeocodingResult}
+
+    results: Optional[list[GeocodingResult]] = None
+    generationtime_ms: Optional[float] = None
 
 
 # Historical Weather (uses same models as forecast)
-class HistoricalWeather(BaseModel):
+class HistoricalWeather(ApiResponse):
     """Historical weather response."""
 
-    latitude: float = Field(..., description="Latitude of the location")
-    longitude: float = Field(..., description="Longitude of the location")
-    elevation: Optional[float] = Field(None, description="Elevation in meters")
-    timezone: Optional[str] = Field(None, description="Timezone name")
-    timezone_abbreviation: Optional[str] = Field(None, description="Timezone abbreviation")
-    hourly: Optional[HourlyWeather] = Field(None, description="Hourly historical data")
-    daily: Optional[DailyWeather] = Field(None, description="Daily historical data")
+    _nested = {"hourly": HourlyWeather, "daily": DailyWeather}
+
+    latitude: float
+    longitude: float
+    elevation: Optional[float] = None
+    timezone: Optional[str] = None
+    timezone_abbreviation: Optional[str] = None
+    hourly: Optional[HourlyWeather] = None
+    daily: Optional[DailyWeather] = None
 
 
 # Air Quality Models
-class HourlyAirQuality(BaseModel):
+class HourlyAirQuality(TimeSeries):
     """Hourly air quality data."""
 
     model_config = ConfigDict(extra="allow")  # Allow additional fields (pollen, etc.)
 
-    time: list[str] = Field(..., description="ISO 8601 timestamps")
-    pm10: Optional[list[Optional[float]]] = Field(None, description="PM10 in µg/m³")
-    pm2_5: Optional[list[Optional[float]]] = Field(None, description="PM2.5 in µg/m³")
-    carbon_monoxide: Optional[list[Optional[float]]] = Field(None, description="CO in µg/m³")
-    nitrogen_dioxide: Optional[list[Optional[float]]] = Field(None, description="NO2 in µg/m³")
-    sulphur_dioxide: Optional[list[Optional[float]]] = Field(None, description="SO2 in µg/m³")
-    ozone: Optional[list[Optional[float]]] = Field(None, description="O3 in µg/m³")
-    dust: Optional[list[Optional[float]]] = Field(None, description="Dust in µg/m³")
-    uv_index: Optional[list[Optional[float]]] = Field(None, description="UV index")
-    us_aqi: Optional[list[Optional[int]]] = Field(None, description="US AQI")
-    european_aqi: Optional[list[Optional[int]]] = Field(None, description="European AQI")
-
-
-class AirQualityResponse(BaseModel):
+    time: list[str]
+    pm10: Optional[list[Optional[float]]] = None
+    pm2_5: Optional[list[Optional[float]]] = None
+    carbon_monoxide: Optional[list[Optional[float]]] = None
+    nitrogen_dioxide: Optional[list[Optional[float]]] = None
+    sulphur_dioxide: Optional[list[Optional[float]]] = None
+    ozone: Optional[list[Optional[float]]] = None
+    dust: Optional[list[Optional[float]]] = None
+    uv_index: Optional[list[Optional[float]]] = None
+    us_aqi: Optional[list[Optional[int]]] = None
+    european_aqi: Optional[list[Optional[int]]] = None
+
+    # Pollen (Europe only; null elsewhere and outside the season)
+    alder_pollen: Optional[list[Optional[float]]] = None
+    birch_pollen: Optional[list[Optional[float]]] = None
+    grass_pollen: Optional[list[Optional[float]]] = None
+    mugwort_pollen: Optional[list[Optional[float]]] = None
+    olive_pollen: Optional[list[Optional[float]]] = None
+    ragweed_pollen: Optional[list[Optional[float]]] = None
+
+
+class AirQualityResponse(ApiResponse):
     """Air quality API response."""
 
-    latitude: float = Field(..., description="Latitude of the location")
-    longitude: float = Field(..., description="Longitude of the location")
-    elevation: Optional[float] = Field(None, description="Elevation in meters")
-    timezone: Optional[str] = Field(None, description="Timezone name")
-    hourly: Optional[HourlyAirQuality] = Field(None, description="Hourly air quality data")
+    _nested = {"hourly": HourlyAirQuality}
+
+    latitude: float
+    longitude: float
+    elevation: Optional[float] = None
+    timezone: Optional[str] = None
+    hourly: Optional[HourlyAirQuality] = None
 
 
 # Marine Forecast Models
-class HourlyMarine(BaseModel):
+class HourlyMarine(TimeSeries):
     """Hourly marine forecast data with wave, swell, and current information.
 
     Wave heights are in meters. For context:
@@ -212,253 +338,172 @@ class HourlyMarine(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    time: list[str] = Field(..., description="ISO 8601 timestamps for each hour")
+    time: list[str]
 
     # Total wave characteristics (combined wind + swell)
-    wave_height: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Total significant wave height in meters (combined wind waves + swell). "
-        "This is the primary metric for wave size. 0-0.5m=calm, 0.5-1.5m=small, "
-        "1.5-2.5m=moderate, 2.5-4m=large, 4m+=very large/dangerous",
-    )
-    wave_direction: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Wave direction in degrees (0-360, meteorological convention: 0=from North, "
-        "90=from East, 180=from South, 270=from West)",
-    )
-    wave_period: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Wave period in seconds (time between wave crests). Higher is better for surfing: "
-        "<8s=choppy, 8-12s=good, 12s+=excellent",
-    )
+    wave_height: Optional[list[Optional[float]]] = None
+    wave_direction: Optional[list[Optional[float]]] = None
+    wave_period: Optional[list[Optional[float]]] = None
 
     # Wind waves (locally generated by current wind)
-    wind_wave_height: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Wind wave height in meters (waves generated by local wind, typically choppy). "
-        "These are less organized than swell",
-    )
-    wind_wave_direction: Optional[list[Optional[float]]] = Field(
-        None, description="Wind wave direction in degrees (0-360, meteorological convention)"
-    )
-    wind_wave_period: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Wind wave period in seconds (usually shorter/choppier than swell)",
-    )
+    wind_wave_height: Optional[list[Optional[float]]] = None
+    wind_wave_direction: Optional[list[Optional[float]]] = None
+    wind_wave_period: Optional[list[Optional[float]]] = None
+    wind_wave_peak_period: Optional[list[Optional[float]]] = None
 
     # Swell waves (from distant storms, more organized)
-    swell_wave_height: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Swell wave height in meters (waves from distant storms, clean and organized). "
-        "These create the best surfing conditions",
-    )
-    swell_wave_direction: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Swell wave direction in degrees (0-360, direction swell is coming FROM)",
-    )
-    swell_wave_period: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Swell wave period in seconds (typically longer than wind waves, 10-20s indicates "
-        "quality swell from distant storms)",
-    )
+    swell_wave_height: Optional[list[Optional[float]]] = None
+    swell_wave_direction: Optional[list[Optional[float]]] = None
+    swell_wave_period: Optional[list[Optional[float]]] = None
+    swell_wave_peak_period: Optional[list[Optional[float]]] = None
 
     # Ocean currents
-    ocean_current_velocity: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Ocean current speed in meters/second. Important for safety: >1 m/s is strong, "
-        ">2 m/s is dangerous for swimming",
-    )
-    ocean_current_direction: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Ocean current direction in degrees (0-360, direction current is flowing TOWARDS)",
-    )
+    ocean_current_velocity: Optional[list[Optional[float]]] = None
+    ocean_current_direction: Optional[list[Optional[float]]] = None
 
     # Tides and sea level
-    sea_level_height_msl: Optional[list[Optional[float]]] = Field(
-        None,
-        description="Sea level height in meters relative to mean sea level, accounting for tides, inverted "
-        "barometer effect, and sea surface height variations. Positive values indicate higher water, "
-        "negative values indicate lower water. Use this for tide predictions and timing beach/surf activities. "
-        "The tidal cycle is clearly visible in this data (high/low tides every ~6 hours). "
-        "Note: Accuracy is limited in coastal areas - use with caution and not for navigation.",
-    )
+    sea_level_height_msl: Optional[list[Optional[float]]] = None
+
+    # Water temperature
+    sea_surface_temperature: Optional[list[Optional[float]]] = None
 
 
-class DailyMarine(BaseModel):
+class DailyMarine(TimeSeries):
     """Daily marine forecast data."""
 
     model_config = ConfigDict(extra="allow")
 
-    time: list[str] = Field(..., description="ISO 8601 dates")
-    wave_height_max: Optional[list[Optional[float]]] = Field(
-        None, description="Maximum wave height"
-    )
-    wave_direction_dominant: Optional[list[Optional[float]]] = Field(
-        None, description="Dominant wave direction"
-    )
-    wave_period_max: Optional[list[Optional[float]]] = Field(
-        None, description="Maximum wave period"
-    )
+    time: list[str]
+    wave_height_max: Optional[list[Optional[float]]] = None
+    wave_direction_dominant: Optional[list[Optional[float]]] = None
+    wave_period_max: Optional[list[Optional[float]]] = None
 
 
-class MarineForecast(BaseModel):
+class MarineForecast(ApiResponse):
     """Marine forecast API response."""
 
-    latitude: float = Field(..., description="Latitude of the location")
-    longitude: float = Field(..., description="Longitude of the location")
-    elevation: Optional[float] = Field(None, description="Elevation in meters")
-    timezone: Optional[str] = Field(None, description="Timezone name")
-    hourly: Optional[HourlyMarine] = Field(None, description="Hourly marine forecast")
-    daily: Optional[DailyMarine] = Field(None, description="Daily marine forecast")
+    _nested = {"hourly": HourlyMarine, "daily": DailyMarine}
+
+    latitude: float
+    longitude: float
+    elevation: Optional[float] = None
+    timezone: Optional[str] = None
+    hourly: Optional[HourlyMarine] = None
+    daily: Optional[DailyMarine] = None
+
+
+# Combined Conditions
+class FullConditionsResponse(BaseModel):
+    """Forecast, air quality and (optionally) marine data for one location."""
+
+    latitude: float
+    longitude: float
+    forecast: WeatherForecast
+    air_quality: Optional[AirQualityResponse] = None
+    marine: Optional[MarineForecast] = None
+    errors: list[str] = []
 
 
 # Weather Code Interpretation
 class WeatherCodeInterpretation(BaseModel):
     """Interpretation of WMO weather code."""
 
-    code: int = Field(..., description="WMO weather code number (0-99)")
-    description: str = Field(..., description="Human-readable weather condition description")
-    severity: str = Field(
-        ...,
-        description="Weather severity category: clear, cloudy, fog, drizzle, rain, freezing, snow, showers, thunderstorm, unknown",
-    )
-    icon: str = Field(
-        "",
-        description="Weather icon URL (PNG). Put this in a GeoJSON feature's 'icon' property to show as a map marker.",
-    )
+    model_config = ConfigDict(frozen=True)
+
+    code: int
+    description: str
+    severity: str
+    icon: str = ""
 
 
 # Batch Response Models
 class BatchWeatherCodeItem(BaseModel):
     """A single weather code interpretation within a batch response."""
 
-    code: int = Field(..., description="WMO weather code number (0-99)")
-    description: str = Field(..., description="Human-readable weather condition description")
-    severity: str = Field(
-        ...,
-        description="Weather severity category: clear, cloudy, fog, drizzle, rain, freezing, snow, showers, thunderstorm, unknown",
-    )
-    icon: str = Field(
-        "",
-        description="Weather icon URL (PNG). Put this in a GeoJSON feature's 'icon' property to show as a map marker.",
-    )
+    model_config = ConfigDict(frozen=True)
+
+    code: int
+    description: str
+    severity: str
+    icon: str = ""
 
 
 class BatchWeatherCodeResponse(BaseModel):
     """Response from batch weather code interpretation."""
 
-    results: list[BatchWeatherCodeItem] = Field(
-        ..., description="Interpretations for each weather code, in the same order as input"
-    )
-    total_codes: int = Field(..., description="Total number of codes submitted")
+    results: list[BatchWeatherCodeItem]
+    total_codes: int
 
 
 class BatchGeocodingItem(BaseModel):
     """Result for a single location in a batch geocoding request."""
 
-    query: str = Field(..., description="The original location name that was searched")
-    found: bool = Field(..., description="Whether any results were found for this query")
-    results: Optional[list[GeocodingResult]] = Field(
-        None, description="List of matching locations (None if not found)"
-    )
-    error: Optional[str] = Field(
-        None, description="Error message if the geocoding request failed for this location"
-    )
+    query: str
+    found: bool
+    results: Optional[list[GeocodingResult]] = None
+    error: Optional[str] = None
 
 
 class BatchGeocodingResponse(BaseModel):
     """Response from batch geocoding multiple locations concurrently."""
 
-    results: list[BatchGeocodingItem] = Field(
-        ..., description="Results for each queried location, in the same order as the input"
-    )
-    total_queries: int = Field(..., description="Total number of location queries submitted")
-    successful: int = Field(
-        ..., description="Number of locations that returned at least one result"
-    )
-    failed: int = Field(
-        ..., description="Number of locations that returned no results or had errors"
-    )
+    results: list[BatchGeocodingItem]
+    total_queries: int
+    successful: int
+    failed: int
 
 
 class BatchWeatherForecastItem(BaseModel):
     """A single forecast within a batch response, tagged with a location index."""
 
-    location_index: int = Field(
-        ...,
-        description="Zero-based index corresponding to the position in the input latitude/longitude arrays",
-    )
-    forecast: WeatherForecast = Field(
-        ..., description="The weather forecast data for this location"
-    )
+    location_index: int
+    forecast: WeatherForecast
 
 
 class BatchWeatherForecastResponse(BaseModel):
     """Response from batch weather forecast for multiple locations."""
 
-    results: list[BatchWeatherForecastItem] = Field(
-        ..., description="Weather forecasts for each location, indexed by position in input arrays"
-    )
-    total_locations: int = Field(..., description="Total number of locations queried")
+    results: list[BatchWeatherForecastItem]
+    total_locations: int
 
 
 class BatchAirQualityItem(BaseModel):
     """A single air quality result within a batch response."""
 
-    location_index: int = Field(
-        ...,
-        description="Zero-based index corresponding to the position in the input latitude/longitude arrays",
-    )
-    air_quality: AirQualityResponse = Field(
-        ..., description="The air quality data for this location"
-    )
+    location_index: int
+    air_quality: AirQualityResponse
 
 
 class BatchAirQualityResponse(BaseModel):
     """Response from batch air quality query for multiple locations."""
 
-    results: list[BatchAirQualityItem] = Field(
-        ..., description="Air quality data for each location, indexed by position in input arrays"
-    )
-    total_locations: int = Field(..., description="Total number of locations queried")
+    results: list[BatchAirQualityItem]
+    total_locations: int
 
 
 class BatchMarineForecastItem(BaseModel):
     """A single marine forecast within a batch response."""
 
-    location_index: int = Field(
-        ...,
-        description="Zero-based index corresponding to the position in the input latitude/longitude arrays",
-    )
-    forecast: MarineForecast = Field(..., description="The marine forecast data for this location")
+    location_index: int
+    forecast: MarineForecast
 
 
 class BatchMarineForecastResponse(BaseModel):
     """Response from batch marine forecast for multiple locations."""
 
-    results: list[BatchMarineForecastItem] = Field(
-        ..., description="Marine forecasts for each location, indexed by position in input arrays"
-    )
-    total_locations: int = Field(..., description="Total number of locations queried")
+    results: list[BatchMarineForecastItem]
+    total_locations: int
 
 
 class BatchHistoricalWeatherItem(BaseModel):
     """A single historical weather result within a batch response."""
 
-    location_index: int = Field(
-        ...,
-        description="Zero-based index corresponding to the position in the input latitude/longitude arrays",
-    )
-    weather: HistoricalWeather = Field(
-        ..., description="The historical weather data for this location"
-    )
+    location_index: int
+    weather: HistoricalWeather
 
 
 class BatchHistoricalWeatherResponse(BaseModel):
     """Response from batch historical weather query for multiple locations."""
 
-    results: list[BatchHistoricalWeatherItem] = Field(
-        ...,
-        description="Historical weather data for each location, indexed by position in input arrays",
-    )
-    total_locations: int = Field(..., description="Total number of locations queried")
+    results: list[BatchHistoricalWeatherItem]
+    total_locations: int
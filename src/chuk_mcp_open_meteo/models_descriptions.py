@@ -0,0 +1,305 @@
+"""Field descriptions for the response models in ``models.py``.
+
+The models themselves carry no per-field ``description=`` metadata, which keeps
+class creation lean at import time. The text lives here and is merged in only
+when a JSON schema is generated for documentation or MCP tool output.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+DESCRIPTIONS: dict[str, dict[str, str]] = {
+    "CurrentWeather": {
+        "temperature": "Current temperature in requested unit (celsius or fahrenheit)",
+        "windspeed": "Current wind speed in requested unit (km/h, m/s, mph, or knots)",
+        "winddirection": (
+            "Wind direction in degrees (0-360, meteorological: 0=from North, 90=from East, "
+            "180=from South, 270=from West)"
+        ),
+        "weathercode": (
+            "WMO weather code (0-99). Use interpret_weather_code tool to get description. Common: "
+            "0=clear, 1-3=cloudy, 45/48=fog, 51-67=rain/drizzle, 71-77=snow, 95-99=thunderstorm"
+        ),
+        "time": "ISO 8601 timestamp of current conditions",
+    },
+    "HourlyWeather": {
+        "time": "ISO 8601 timestamps for each hour",
+        "temperature_2m": "Temperature at 2 meters height in requested unit",
+        "relative_humidity_2m": "Relative humidity at 2 meters (0-100%)",
+        "precipitation": (
+            "Total precipitation (rain + snow + showers) in requested unit (mm or inch). 0=no "
+            "precipitation"
+        ),
+        "rain": "Rain amount only (excluding snow/showers)",
+        "showers": "Shower precipitation amount",
+        "snowfall": "Snowfall amount in cm or inch",
+        "cloud_cover": "Total cloud cover percentage (0-100%). 0=clear, 100=overcast",
+        "wind_speed_10m": "Wind speed at 10 meters height in requested unit",
+        "wind_direction_10m": (
+            "Wind direction at 10m in degrees (0-360, from North=0, East=90, South=180, West=270)"
+        ),
+        "pressure_msl": "Atmospheric pressure at sea level in hPa",
+        "visibility": "Visibility distance in meters",
+        "uv_index": "UV index (0-11+). 3+=protection needed, 8+=very high",
+    },
+    "DailyWeather": {
+        "time": "ISO 8601 dates (YYYY-MM-DD format)",
+        "temperature_2m_max": "Maximum (high) temperature for the day in requested unit",
+        "temperature_2m_min": "Minimum (low) temperature for the day in requested unit",
+        "precipitation_sum": (
+            "Total precipitation for the day (rain + snow) in requested unit (mm or inch)"
+        ),
+        "precipitation_hours": "Number of hours with precipitation during the day (0-24)",
+        "rain_sum": "Total rain for the day (excluding snow)",
+        "sunrise": "Sunrise time in ISO 8601 format",
+        "sunset": "Sunset time in ISO 8601 format",
+        "wind_speed_10m_max": "Maximum wind speed during the day in requested unit",
+    },
+    "WeatherForecast": {
+        "latitude": "Latitude of the location",
+        "longitude": "Longitude of the location",
+        "elevation": "Elevation in meters",
+        "timezone": "Timezone name",
+        "timezone_abbreviation": "Timezone abbreviation",
+        "current_weather": "Current weather",
+        "hourly": "Hourly forecast",
+        "daily": "Daily forecast",
+    },
+    "GeocodingResult": {
+        "id": "Location ID",
+        "name": "Location name",
+        "latitude": "Latitude",
+        "longitude": "Longitude",
+        "elevation": "Elevation in meters",
+        "feature_code": "GeoNames feature code",
+        "country_code": "ISO 3166-1 alpha-2 country code",
+        "country": "Country name",
+        "country_id": "Country ID",
+        "timezone": "Timezone name",
+        "population": "Population",
+        "postcodes": "Postcodes",
+        "admin1": "Administrative division level 1",
+        "admin2": "Administrative division level 2",
+        "admin3": "Administrative division level 3",
+        "admin4": "Administrative division level 4",
+    },
+    "GeocodingResponse": {
+        "results": "List of matching locations",
+        "generationtime_ms": "Generation time in ms",
+    },
+    "HistoricalWeather": {
+        "latitude": "Latitude of the location",
+        "longitude": "Longitude of the location",
+        "elevation": "Elevation in meters",
+        "timezone": "Timezone name",
+        "timezone_abbreviation": "Timezone abbreviation",
+        "hourly": "Hourly historical data",
+        "daily": "Daily historical data",
+    },
+    "HourlyAirQuality": {
+        "time": "ISO 8601 timestamps",
+        "pm10": "PM10 in µg/m³",
+        "pm2_5": "PM2.5 in µg/m³",
+        "carbon_monoxide": "CO in µg/m³",
+        "nitrogen_dioxide": "NO2 in µg/m³",
+        "sulphur_dioxide": "SO2 in µg/m³",
+        "ozone": "O3 in µg/m³",
+        "dust": "Dust in µg/m³",
+        "uv_index": "UV index",
+        "us_aqi": "US AQI",
+        "european_aqi": "European AQI",
+        "alder_pollen": "Alder pollen in grains/m³ (Europe only)",
+        "birch_pollen": "Birch pollen in grains/m³ (Europe only)",
+        "grass_pollen": "Grass pollen in grains/m³ (Europe only)",
+        "mugwort_pollen": "Mugwort pollen in grains/m³ (Europe only)",
+        "olive_pollen": "Olive pollen in grains/m³ (Europe only)",
+        "ragweed_pollen": "Ragweed pollen in grains/m³ (Europe only)",
+    },
+    "AirQualityResponse": {
+        "latitude": "Latitude of the location",
+        "longitude": "Longitude of the location",
+        "elevation": "Elevation in meters",
+        "timezone": "Timezone name",
+        "hourly": "Hourly air quality data",
+    },
+    "HourlyMarine": {
+        "time": "ISO 8601 timestamps for each hour",
+        "wave_height": (
+            "Total significant wave height in meters (combined wind waves + swell). This is the "
+            "primary metric for wave size. 0-0.5m=calm, 0.5-1.5m=small, 1.5-2.5m=moderate, "
+            "2.5-4m=large, 4m+=very large/dangerous"
+        ),
+        "wave_direction": (
+            "Wave direction in degrees (0-360, meteorological convention: 0=from North, 90=from "
+            "East, 180=from South, 270=from West)"
+        ),
+        "wave_period": (
+            "Wave period in seconds (time between wave crests). Higher is better for surfing: "
+            "<8s=choppy, 8-12s=good, 12s+=excellent"
+        ),
+        "wind_wave_height": (
+            "Wind wave height in meters (waves generated by local wind, typically choppy). These "
+            "are less organized than swell"
+        ),
+        "wind_wave_direction": "Wind wave direction in degrees (0-360, meteorological convention)",
+        "wind_wave_period": "Wind wave period in seconds (usually shorter/choppier than swell)",
+        "wind_wave_peak_period": "Peak period of wind waves in seconds",
+        "swell_wave_height": (
+            "Swell wave height in meters (waves from distant storms, clean and organized). These "
+            "create the best surfing conditions"
+        ),
+        "swell_wave_direction": (
+            "Swell wave direction in degrees (0-360, direction swell is coming FROM)"
+        ),
+        "swell_wave_period": (
+            "Swell wave period in seconds (typically longer than wind waves, 10-20s indicates "
+            "quality swell from distant storms)"
+        ),
+        "swell_wave_peak_period": "Peak period of swell in seconds",
+        "ocean_current_velocity": (
+            "Ocean current speed in meters/second. Important for safety: >1 m/s is strong, >2 m/s "
+            "is dangerous for swimming"
+        ),
+        "ocean_current_direction": (
+            "Ocean current direction in degrees (0-360, direction current is flowing TOWARDS)"
+        ),
+        "sea_level_height_msl": (
+            "Sea level height in meters relative to mean sea level, accounting for tides, inverted "
+            "barometer effect, and sea surface height variations. Positive values indicate higher "
+            "water, negative values indicate lower water. Use this for tide predictions and timing "
+            "beach/surf activities. The tidal cycle is clearly visible in this data (high/low "
+            "tides every ~6 hours). Note: Accuracy is limited in coastal areas - use with caution "
+            "and not for navigation."
+        ),
+        "sea_surface_temperature": "Sea surface (water) temperature in °C",
+    },
+    "DailyMarine": {
+        "time": "ISO 8601 dates",
+        "wave_height_max": "Maximum wave height",
+        "wave_direction_dominant": "Dominant wave direction",
+        "wave_period_max": "Maximum wave period",
+    },
+    "MarineForecast": {
+        "latitude": "Latitude of the location",
+        "longitude": "Longitude of the location",
+        "elevation": "Elevation in meters",
+        "timezone": "Timezone name",
+        "hourly": "Hourly marine forecast",
+        "daily": "Daily marine forecast",
+    },
+    "FullConditionsResponse": {
+        "latitude": "Requested latitude",
+        "longitude": "Requested longitude",
+        "forecast": "Current conditions and daily forecast",
+        "air_quality": "Hourly air quality data (None if not requested or unavailable)",
+        "marine": "Marine forecast (only when include_marine=True)",
+        "errors": "Why an optional part (air_quality, marine) could not be fetched, if any",
+    },
+    "WeatherCodeInterpretation": {
+        "code": "WMO weather code number (0-99)",
+        "description": "Human-readable weather condition description",
+        "severity": (
+            "Weather severity category: clear, cloudy, fog, drizzle, rain, freezing, snow, "
+            "showers, thunderstorm, unknown"
+        ),
+        "icon": (
+            "Weather icon URL (PNG). Put this in a GeoJSON feature's 'icon' property to show as a "
+            "map marker."
+        ),
+    },
+    "BatchWeatherCodeItem": {
+        "code": "WMO weather code number (0-99)",
+        "description": "Human-readable weather condition description",
+        "severity": (
+            "Weather severity category: clear, cloudy, fog, drizzle, rain, freezing, snow, "
+            "showers, thunderstorm, unknown"
+        ),
+        "icon": (
+            "Weather icon URL (PNG). Put this in a GeoJSON feature's 'icon' property to show as a "
+            "map marker."
+        ),
+    },
+    "BatchWeatherCodeResponse": {
+        "results": "Interpretations for each weather code, in the same order as input",
+        "total_codes": "Total number of codes submitted",
+    },
+    "BatchGeocodingItem": {
+        "query": "The original location name that was searched",
+        "found": "Whether any results were found for this query",
+        "results": "List of matching locations (None if not found)",
+        "error": "Error message if the geocoding request failed for this location",
+    },
+    "BatchGeocodingResponse": {
+        "results": "Results for each queried location, in the same order as the input",
+        "total_queries": "Total number of location queries submitted",
+        "successful": "Number of locations that returned at least one result",
+        "failed": "Number of locations that returned no results or had errors",
+    },
+    "BatchWeatherForecastItem": {
+        "location_index": (
+            "Zero-based index corresponding to the position in the input latitude/longitude arrays"
+        ),
+        "forecast": "The weather forecast data for this location",
+    },
+    "BatchWeatherForecastResponse": {
+        "results": "Weather forecasts for each location, indexed by position in input arrays",
+        "total_locations": "Total number of locations queried",
+    },
+    "BatchAirQualityItem": {
+        "location_index": (
+            "Zero-based index corresponding to the position in the input latitude/longitude arrays"
+        ),
+        "air_quality": "The air quality data for this location",
+    },
+    "BatchAirQualityResponse": {
+        "results": "Air quality data for each location, indexed by position in input arrays",
+        "total_locations": "Total number of locations queried",
+    },
+    "BatchMarineForecastItem": {
+        "location_index": (
+            "Zero-based index corresponding to the position in the input latitude/longitude arrays"
+        ),
+        "forecast": "The marine forecast data for this location",
+    },
+    "BatchMarineForecastResponse": {
+        "results": "Marine forecasts for each location, indexed by position in input arrays",
+        "total_locations": "Total number of locations queried",
+    },
+    "BatchHistoricalWeatherItem": {
+        "location_index": (
+            "Zero-based index corresponding to the position in the input latitude/longitude arrays"
+        ),
+        "weather": "The historical weather data for this location",
+    },
+    "BatchHistoricalWeatherResponse": {
+        "results": "Historical weather data for each location, indexed by position in input arrays",
+        "total_locations": "Total number of locations queried",
+    },
+}
+
+
+def schema_with_descriptions(model: type[BaseModel]) -> dict[str, Any]:
+    """Return the model's JSON schema with field descriptions merged in.
+
+    Descriptions are applied to the model itself and to every nested model in
+    ``$defs``, so e.g. ``WeatherForecast``'s schema also documents ``CurrentWeather``.
+
+    Args:
+        model: A response model class from ``chuk_mcp_open_meteo.models``
+
+    Returns:
+        The JSON schema dict, as from ``model.model_json_schema()``
+
+    Example:
+        schema = schema_with_descriptions(WeatherForecast)
+        schema["properties"]["latitude"]["description"]  # "Latitude of the location"
+    """
+    schema = model.model_json_schema()
+    definitions = [(model.__name__, schema), *schema.get("$defs", {}).items()]
+    for name, definition in definitions:
+        properties = definition.get("properties", {})
+        for field, text in DESCRIPTIONS.get(name, {}).items():
+            if field in properties:
+                properties[field]["description"] = text
+    return schema
@@ -3,16 +3,20 @@
 Imports tool modules to register @tool decorators, then runs the server.
 """
 
+import asyncio
 import logging
+import logging.config
 import sys
 
 from chuk_mcp_server import run
 
 # Import the tools package — this triggers @tool registration for all tools.
 from . import tools  # noqa: F401
+from ._http import set_shared_client
 
 # Re-export tool functions so existing imports (e.g. tests, scripts) keep working.
 from .tools.air_quality import batch_get_air_quality, get_air_quality
+from .tools.conditions import get_full_conditions
 from .tools.forecast import batch_get_weather_forecasts, get_weather_forecast
 from .tools.geocoding import batch_geocode_locations, geocode_location
 from .tools.historical import batch_get_historical_weather, get_historical_weather
@@ -27,6 +31,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# STDIO mode: only errors from the transport stack and httpx (API calls). Incremental, so the
+# stderr handler installed above is left in place and only logger levels change.
+_STDIO_LOGGING = {
+    "version": 1,
+    "incremental": True,
+    "loggers": {
+        "chuk_mcp_server": {"level": "ERROR"},
+        "chuk_mcp_server.core": {"level": "ERROR"},
+        "chuk_mcp_server.stdio_transport": {"level": "ERROR"},
+        "httpx": {"level": "ERROR"},
+    },
+}
+
 __all__ = [
     "batch_geocode_locations",
     "batch_get_air_quality",
@@ -36,14 +53,25 @@ __all__ = [
     "batch_interpret_weather_codes",
     "geocode_location",
     "get_air_quality",
+    "get_full_conditions",
     "get_historical_weather",
     "get_marine_forecast",
     "get_weather_forecast",
     "interpret_weather_code",
     "main",
+    "set_shared_client",
 ]
 
 
+def _use_uvloop() -> None:
+    """Make asyncio.run() use uvloop if it is installed (the ``perf`` extra)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     """Run the Open-Meteo MCP server."""
     # Check if transport is specified in command line args
@@ -56,14 +84,11 @@ def main():
         # Only log in HTTP mode
         logger.warning("Starting Chuk MCP Open-Meteo Server in HTTP mode")
 
-    # Suppress chuk_mcp_server logging in STDIO mode
+    # Suppress chuk_mcp_server and httpx logging in STDIO mode
     if transport == "stdio":
-        # Set chuk_mcp_server loggers to ERROR only
-        logging.getLogger("chuk_mcp_server").setLevel(logging.ERROR)
-        logging.getLogger("chuk_mcp_server.core").setLevel(logging.ERROR)
-        logging.getLogger("chuk_mcp_server.stdio_transport").setLevel(logging.ERROR)
-        # Suppress httpx logging (API calls)
-        logging.getLogger("httpx").setLevel(logging.ERROR)
+        logging.config.dictConfig(_STDIO_LOGGING)
+        # HTTP mode already runs on uvloop via uvicorn; the STDIO transport uses asyncio.run()
+        _use_uvloop()
 
     run(transport=transport)
 
@@ -1,3 +1,11 @@
 """Open-Meteo MCP tools — import all tool modules to register @tool decorators."""
 
-from . import air_quality, forecast, geocoding, historical, marine, weather_codes  # noqa: F401
+from . import (  # noqa: F401
+    air_quality,
+    conditions,
+    forecast,
+    geocoding,
+    historical,
+    marine,
+    weather_codes,
+)
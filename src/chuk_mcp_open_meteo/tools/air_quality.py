@@ -2,11 +2,13 @@
 
 from typing import Any, Optional
 
-import httpx
 from chuk_mcp_server import tool
 
 from .._batch import batch_fetch
+from .._cache import AIR_QUALITY_TTL
 from .._constants import AIR_QUALITY_API, DEFAULT_AIR_QUALITY_HOURLY
+from .._fetch import fetch_cached
+from .._validation import check_coordinates
 from ..models import (
     AirQualityResponse,
     BatchAirQualityItem,
@@ -14,6 +16,27 @@ from ..models import (
 )
 
 
+async def _air_quality(
+    latitude: float,
+    longitude: float,
+    timezone: str = "auto",
+    hourly: Optional[str] = None,
+    domains: str = "auto",
+) -> AirQualityResponse:
+    """Implementation of get_air_quality, callable without the MCP tool wrapper."""
+    check_coordinates(latitude, longitude)
+
+    params = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "timezone": timezone,
+        "domains": domains,
+        "hourly": hourly or DEFAULT_AIR_QUALITY_HOURLY,
+    }
+
+    return await fetch_cached(AIR_QUALITY_API, params, AirQualityResponse, AIR_QUALITY_TTL)
+
+
 @tool
 async def get_air_quality(
     latitude: float,
@@ -40,20 +63,13 @@ async def get_air_quality(
             aqi = air.hourly.us_aqi[0]
             print(f"US AQI: {aqi}")
     """
-    params = {
-        "latitude": latitude,
-        "longitude": longitude,
-        "timezone": timezone,
-        "domains": domains,
-        "hourly": hourly or DEFAULT_AIR_QUALITY_HOURLY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(AIR_QUALITY_API, params=params, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
-
-    return AirQualityResponse(**data)
+    return await _air_quality(
+        latitude=latitude,
+        longitude=longitude,
+        timezone=timezone,
+        hourly=hourly,
+        domains=domains,
+    )
 
 
 @tool
@@ -0,0 +1,94 @@
+"""Combined conditions tool — forecast, air quality and marine data in one call."""
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any, Optional
+
+from chuk_mcp_server import tool
+
+from ..models import FullConditionsResponse
+from .air_quality import _air_quality
+from .forecast import _weather_forecast
+from .marine import _marine_forecast
+
+
+@tool
+async def get_full_conditions(
+    latitude: float,
+    longitude: float,
+    timezone: str = "auto",
+    forecast_days: int = 3,
+    daily: Optional[str] = "temperature_2m_max,temperature_2m_min,precipitation_sum,weather_code",
+    include_air_quality: bool = True,
+    include_marine: bool = False,
+) -> FullConditionsResponse:
+    """Get weather, air quality and (optionally) marine conditions for one location at once.
+
+    The forecast, air quality and marine requests are sent concurrently, so this takes
+    about as long as the slowest of them instead of the sum of three separate tool calls.
+    If the air quality or marine request fails, that part is left as None and the failure
+    is listed in ``errors``; a failed forecast request raises as usual.
+
+    Args:
+        latitude: Latitude coordinate in decimal degrees (-90 to 90). Use geocode_location to find coordinates.
+        longitude: Longitude coordinate in decimal degrees (-180 to 180). Use geocode_location to find coordinates.
+        timezone: Timezone name or "auto" for automatic detection
+        forecast_days: Number of forecast days (1-16). Default is 3.
+        daily: Comma-separated daily forecast variables (same as get_weather_forecast)
+        include_air_quality: Also fetch current air quality. Default is True.
+        include_marine: Also fetch the marine forecast (waves, swell, tides). Only useful
+            for coastal locations. Default is False.
+
+    Returns:
+        FullConditionsResponse: Contains:
+            - forecast: WeatherForecast with current conditions and daily data
+            - air_quality: AirQualityResponse with the default pollutant set, or None
+            - marine: MarineForecast, or None unless include_marine=True
+            - errors: One message per optional part that could not be fetched
+
+    Tips for LLMs:
+        - Use this for "what are conditions like in X" or "is it a good day to go out" questions
+        - Set include_marine=True for beaches, surfing, sailing or tide questions
+        - If errors is non-empty, mention that part of the data is unavailable
+        - For a single kind of data, the dedicated tools accept more options
+
+    Example:
+        conditions = await get_full_conditions(51.5072, -0.1276)
+        temp = conditions.forecast.current_weather.temperature
+        if conditions.air_quality:
+            aqi = conditions.air_quality.hourly.us_aqi[0]
+    """
+    # Plain helpers rather than the @tool wrappers, which are typed as opaque callables
+    calls: dict[str, Awaitable[Any]] = {
+        "forecast": _weather_forecast(
+            latitude=latitude,
+            longitude=longitude,
+            timezone=timezone,
+            forecast_days=forecast_days,
+            current_weather=True,
+            daily=daily,
+        )
+    }
+    if include_air_quality:
+        calls["air_quality"] = _air_quality(
+            latitude=latitude, longitude=longitude, timezone=timezone
+        )
+    if include_marine:
+        calls["marine"] = _marine_forecast(
+            latitude=latitude, longitude=longitude, timezone=timezone, forecast_days=forecast_days
+        )
+
+    outcomes = dict(zip(calls, await asyncio.gather(*calls.values(), return_exceptions=True)))
+
+    # The forecast is required; air quality and marine data are best-effort extras.
+    parts: dict[str, Any] = {}
+    errors: list[str] = []
+    for name, outcome in outcomes.items():
+        if not isinstance(outcome, BaseException):
+            parts[name] = outcome
+        elif name == "forecast" or not isinstance(outcome, Exception):
+            raise outcome
+        else:
+            errors.append(f"{name}: {type(outcome).__name__}: {outcome}")
+
+    return FullConditionsResponse(latitude=latitude, longitude=longitude, errors=errors, **parts)
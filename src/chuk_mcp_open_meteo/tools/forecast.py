@@ -2,11 +2,13 @@
 
 from typing import Any, Optional
 
-import httpx
 from chuk_mcp_server import tool
 
 from .._batch import batch_fetch
+from .._cache import FORECAST_TTL
 from .._constants import FORECAST_API
+from .._fetch import fetch_cached
+from .._validation import check_coordinates, check_forecast_days
 from ..models import (
     BatchWeatherForecastItem,
     BatchWeatherForecastResponse,
@@ -14,6 +16,44 @@ from ..models import (
 )
 
 
+async def _weather_forecast(
+    latitude: float,
+    longitude: float,
+    temperature_unit: str = "celsius",
+    wind_speed_unit: str = "kmh",
+    precipitation_unit: str = "mm",
+    timezone: str = "auto",
+    forecast_days: int = 7,
+    current_weather: bool = True,
+    hourly: Optional[str] = None,
+    daily: Optional[str] = None,
+) -> WeatherForecast:
+    """Implementation of get_weather_forecast, callable without the MCP tool wrapper."""
+    check_coordinates(latitude, longitude)
+    check_forecast_days(forecast_days)
+
+    params = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "temperature_unit": temperature_unit,
+        "wind_speed_unit": wind_speed_unit,
+        "precipitation_unit": precipitation_unit,
+        "timezone": timezone,
+        "forecast_days": forecast_days,
+    }
+
+    if current_weather:
+        params["current_weather"] = "true"
+
+    if hourly:
+        params["hourly"] = hourly
+
+    if daily:
+        params["daily"] = daily
+
+    return await fetch_cached(FORECAST_API, params, WeatherForecast, FORECAST_TTL)
+
+
 @tool
 async def get_weather_forecast(
     latitude: float,
@@ -87,31 +127,18 @@ async def get_weather_forecast(
             daily="temperature_2m_max,temperature_2m_min,precipitation_sum"
         )
     """
-    params = {
-        "latitude": latitude,
-        "longitude": longitude,
-        "temperature_unit": temperature_unit,
-        "wind_speed_unit": wind_speed_unit,
-        "precipitation_unit": precipitation_unit,
-        "timezone": timezone,
-        "forecast_days": forecast_days,
-    }
-
-    if current_weather:
-        params["current_weather"] = "true"
-
-    if hourly:
-        params["hourly"] = hourly
-
-    if daily:
-        params["daily"] = daily
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(FORECAST_API, params=params, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
-
-    return WeatherForecast(**data)
+    return await _weather_forecast(
+        latitude=latitude,
+        longitude=longitude,
+        temperature_unit=temperature_unit,
+        wind_speed_unit=wind_speed_unit,
+        precipitation_unit=precipitation_unit,
+        timezone=timezone,
+        forecast_days=forecast_days,
+        current_weather=current_weather,
+        hourly=hourly,
+        daily=daily,
+    )
 
 
 @tool
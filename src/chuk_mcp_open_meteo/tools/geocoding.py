@@ -2,10 +2,11 @@
 
 import asyncio
 
-import httpx
 from chuk_mcp_server import tool
 
+from .._cache import GEOCODING_TTL
 from .._constants import GEOCODING_API
+from .._fetch import fetch_cached
 from ..models import (
     BatchGeocodingItem,
     BatchGeocodingResponse,
@@ -91,12 +92,7 @@ async def geocode_location(
         "format": format,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(GEOCODING_API, params=params, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
-
-    return GeocodingResponse(**data)
+    return await fetch_cached(GEOCODING_API, params, GeocodingResponse, GEOCODING_TTL)
 
 
 @tool
@@ -158,7 +154,7 @@ async def batch_geocode_locations(
 
     semaphore = asyncio.Semaphore(10)
 
-    async def _geocode_one(client: httpx.AsyncClient, name: str) -> BatchGeocodingItem:
+    async def _geocode_one(name: str) -> BatchGeocodingItem:
         async with semaphore:
             try:
                 params = {
@@ -167,11 +163,11 @@ async def batch_geocode_locations(
                     "language": language,
                     "format": "json",
                 }
-                response = await client.get(GEOCODING_API, params=params, timeout=30.0)
-                response.raise_for_status()
-                data = response.json()
+                # Shares cache entries with geocode_location for the same query
+                geo_response = await fetch_cached(
+                    GEOCODING_API, params, GeocodingResponse, GEOCODING_TTL
+                )
 
-                geo_response = GeocodingResponse(**data)
                 has_results = geo_response.results is not None and len(geo_response.results) > 0
                 return BatchGeocodingItem(
                     query=name,
@@ -187,8 +183,7 @@ async def batch_geocode_locations(
                     error=f"{type(e).__name__}: {e}",
                 )
 
-    async with httpx.AsyncClient() as client:
-        items = await asyncio.gather(*[_geocode_one(client, name) for name in location_names])
+    items = await asyncio.gather(*[_geocode_one(name) for name in location_names])
 
     successful = sum(1 for item in items if item.found)
 
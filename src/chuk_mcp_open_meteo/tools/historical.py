@@ -2,11 +2,13 @@
 
 from typing import Any, Optional
 
-import httpx
 from chuk_mcp_server import tool
 
 from .._batch import batch_fetch
+from .._cache import historical_ttl
 from .._constants import HISTORICAL_API
+from .._fetch import fetch_cached
+from .._validation import check_coordinates, check_date_range
 from ..models import (
     BatchHistoricalWeatherItem,
     BatchHistoricalWeatherResponse,
@@ -52,6 +54,9 @@ async def get_historical_weather(
         )
         avg_high = sum(historical.daily.temperature_2m_max) / len(historical.daily.temperature_2m_max)
     """
+    check_coordinates(latitude, longitude)
+    check_date_range(start_date, end_date)
+
     params = {
         "latitude": latitude,
         "longitude": longitude,
@@ -69,12 +74,7 @@ async def get_historical_weather(
     if daily:
         params["daily"] = daily
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(HISTORICAL_API, params=params, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
-
-    return HistoricalWeather(**data)
+    return await fetch_cached(HISTORICAL_API, params, HistoricalWeather, historical_ttl(end_date))
 
 
 @tool
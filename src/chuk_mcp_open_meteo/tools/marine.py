@@ -2,11 +2,13 @@
 
 from typing import Any, Optional
 
-import httpx
 from chuk_mcp_server import tool
 
 from .._batch import batch_fetch
+from .._cache import MARINE_TTL
 from .._constants import DEFAULT_MARINE_HOURLY, MARINE_API
+from .._fetch import fetch_cached
+from .._validation import check_coordinates, check_forecast_days
 from ..models import (
     BatchMarineForecastItem,
     BatchMarineForecastResponse,
@@ -14,6 +16,32 @@ from ..models import (
 )
 
 
+async def _marine_forecast(
+    latitude: float,
+    longitude: float,
+    timezone: str = "auto",
+    hourly: Optional[str] = None,
+    daily: Optional[str] = None,
+    forecast_days: int = 7,
+) -> MarineForecast:
+    """Implementation of get_marine_forecast, callable without the MCP tool wrapper."""
+    check_coordinates(latitude, longitude)
+    check_forecast_days(forecast_days)
+
+    params = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "timezone": timezone,
+        "forecast_days": forecast_days,
+        "hourly": hourly or DEFAULT_MARINE_HOURLY,
+    }
+
+    if daily:
+        params["daily"] = daily
+
+    return await fetch_cached(MARINE_API, params, MarineForecast, MARINE_TTL)
+
+
 @tool
 async def get_marine_forecast(
     latitude: float,
@@ -145,23 +173,14 @@ async def get_marine_forecast(
             forecast_days=7
         )
     """
-    params = {
-        "latitude": latitude,
-        "longitude": longitude,
-        "timezone": timezone,
-        "forecast_days": forecast_days,
-        "hourly": hourly or DEFAULT_MARINE_HOURLY,
-    }
-
-    if daily:
-        params["daily"] = daily
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(MARINE_API, params=params, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
-
-    return MarineForecast(**data)
+    return await _marine_forecast(
+        latitude=latitude,
+        longitude=longitude,
+        timezone=timezone,
+        hourly=hourly,
+        daily=daily,
+        forecast_days=forecast_days,
+    )
 
 
 @tool
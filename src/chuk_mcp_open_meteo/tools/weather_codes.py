@@ -1,14 +1,66 @@
 """Weather code interpretation tools."""
 
+from functools import lru_cache
+from typing import Optional, TypeVar
+
 from chuk_mcp_server import tool
 
-from .._constants import SEVERITY_ICONS, WEATHER_CODES
+from .._constants import SEVERITY_ICONS, WMO_CODE_COUNT, WMO_CODES
 from ..models import (
     BatchWeatherCodeItem,
     BatchWeatherCodeResponse,
     WeatherCodeInterpretation,
 )
 
+M = TypeVar("M", WeatherCodeInterpretation, BatchWeatherCodeItem)
+
+
+def _build_table(model: type[M]) -> tuple[Optional[M], ...]:
+    """Pre-build one shared instance per known WMO code; gaps hold None."""
+    table: list[Optional[M]] = []
+    for code, known in enumerate(WMO_CODES):
+        if known is None:
+            table.append(None)
+            continue
+        description, severity = known
+        table.append(
+            model.model_construct(
+                code=code,
+                description=description,
+                severity=severity,
+                icon=SEVERITY_ICONS.get(severity, ""),
+            )
+        )
+    return tuple(table)
+
+
+@lru_cache(maxsize=256)
+def _unknown(model: type[M], code: int) -> M:
+    """Build the interpretation for an unknown code, reused while the code recurs."""
+    return model.model_construct(
+        code=code,
+        description=f"Unknown weather code: {code}",
+        severity="unknown",
+        icon="",
+    )
+
+
+# Interpretations are frozen models, so one instance per code is shared by every call;
+# callers must treat returned interpretations as read-only.
+_INTERP_TABLE = _build_table(WeatherCodeInterpretation)
+_BATCH_ITEM_TABLE = _build_table(BatchWeatherCodeItem)
+
+
+def _lookup(table: tuple[Optional[M], ...], model: type[M], code: int) -> M:
+    """Return the shared entry for code from table, or the cached unknown-code entry."""
+    known = table[code] if 0 <= code < WMO_CODE_COUNT else None
+    return known if known is not None else _unknown(model, code)
+
+
+def _interpret(code: int) -> WeatherCodeInterpretation:
+    """Interpret a WMO code directly, for use by other modules without the tool layer."""
+    return _lookup(_INTERP_TABLE, WeatherCodeInterpretation, code)
+
 
 @tool
 async def interpret_weather_code(weather_code: int) -> WeatherCodeInterpretation:
@@ -90,21 +142,7 @@ async def interpret_weather_code(weather_code: int) -> WeatherCodeInterpretation
         # Returns: WeatherCodeInterpretation(code=61, description="Slight rain",
         #          severity="rain", icon="https://openweathermap.org/img/wn/10d@2x.png")
     """
-    if weather_code in WEATHER_CODES:
-        info = WEATHER_CODES[weather_code]
-        return WeatherCodeInterpretation(
-            code=weather_code,
-            description=info["description"],
-            severity=info["severity"],
-            icon=SEVERITY_ICONS.get(info["severity"], ""),
-        )
-    else:
-        return WeatherCodeInterpretation(
-            code=weather_code,
-            description=f"Unknown weather code: {weather_code}",
-            severity="unknown",
-            icon="",
-        )
+    return _interpret(weather_code)
 
 
 @tool
@@ -152,24 +190,6 @@ async def batch_interpret_weather_codes(weather_codes: str) -> BatchWeatherCodeR
             )
             continue
 
-        if code in WEATHER_CODES:
-            info = WEATHER_CODES[code]
-            items.append(
-                BatchWeatherCodeItem(
-                    code=code,
-                    description=info["description"],
-                    severity=info["severity"],
-                    icon=SEVERITY_ICONS.get(info["severity"], ""),
-                )
-            )
-        else:
-            items.append(
-                BatchWeatherCodeItem(
-                    code=code,
-                    description=f"Unknown weather code: {code}",
-                    severity="unknown",
-                    icon="",
-                )
-            )
+        items.append(_lookup(_BATCH_ITEM_TABLE, BatchWeatherCodeItem, code))
 
     return BatchWeatherCodeResponse(results=items, total_codes=len(items))
@@ -1,9 +1,21 @@
 """Pytest configuration and fixtures for chuk-mcp-open-meteo tests."""
 
 import asyncio
+import ssl
 
+import httpx
 import pytest
 
+from chuk_mcp_open_meteo._cache import response_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty response cache."""
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
 
 @pytest.fixture
 def london_coords():
@@ -29,31 +41,28 @@ def sample_date_range():
     return {"start_date": "2024-01-01", "end_date": "2024-01-07"}
 
 
+# Connection failures, timeouts and TLS errors are worth retrying; anything else is a real failure
+_NETWORK_ERRORS = (httpx.NetworkError, httpx.TimeoutException, ssl.SSLError)
+
+
 @pytest.fixture
 async def retry_on_network_error():
     """Fixture that provides retry logic for network operations."""
 
     async def _retry(coro_func, max_retries=3, initial_delay=1.0):
         """Retry an async function with exponential backoff on network errors."""
-        for attempt in range(max_retries):
+        delays = tuple(initial_delay * (1 << attempt) for attempt in range(max_retries))
+        for attempt, delay in enumerate(delays):
             try:
                 return await coro_func()
-            except Exception as e:
-                # Check if it's a network-related error
-                error_str = str(type(e).__name__).lower()
-                if any(
-                    keyword in error_str
-                    for keyword in ["connect", "timeout", "network", "tls", "ssl"]
-                ):
-                    if attempt < max_retries - 1:
-                        delay = initial_delay * (2**attempt)
-                        print(
-                            f"Network error on attempt {attempt + 1}/{max_retries}, retrying in {delay}s: {e}"
-                        )
-                        await asyncio.sleep(delay)
-                        continue
-                # Re-raise if not a network error or out of retries
-                raise
+            except _NETWORK_ERRORS as e:
+                # Re-raise once out of retries
+                if attempt == max_retries - 1:
+                    raise
+                print(
+                    f"Network error on attempt {attempt + 1}/{max_retries}, retrying in {delay}s: {e}"
+                )
+                await asyncio.sleep(delay)
         raise Exception(f"Failed after {max_retries} attempts")
 
     return _retry
@@ -732,3 +732,456 @@ async def test_batch_interpret_weather_codes_unknown():
     assert result.results[1].code == 50
     assert result.results[1].severity == "unknown"
     assert result.results[2].severity == "thunderstorm"
+
+
+@pytest.mark.asyncio
+async def test_interpret_weather_code_shares_known_instances():
+    """Test known codes return the prebuilt interpretation and unknown ones are reused."""
+    from chuk_mcp_open_meteo.server import interpret_weather_code
+
+    first = await interpret_weather_code(weather_code=61)
+    assert first is await interpret_weather_code(weather_code=61)
+    assert first.description == "Slight rain" and first.icon.endswith("10d@2x.png")
+
+    for code in (50, -1, 100):
+        unknown = await interpret_weather_code(weather_code=code)
+        assert unknown.code == code and unknown.severity == "unknown" and unknown.icon == ""
+        assert unknown is await interpret_weather_code(weather_code=code)
+
+
+@pytest.mark.asyncio
+async def test_interpret_helper_matches_tool():
+    """Test the synchronous helper returns the same shared instances as the tool."""
+    from chuk_mcp_open_meteo.server import interpret_weather_code
+    from chuk_mcp_open_meteo.tools.weather_codes import _interpret
+
+    assert _interpret(95).severity == "thunderstorm"
+    assert _interpret(95) is await interpret_weather_code(weather_code=95)
+
+
+# --- Combined Conditions Tests ---
+
+
+@pytest.mark.asyncio
+async def test_get_full_conditions_fetches_all_parts():
+    """Test that the combined tool gathers forecast, air quality and marine data."""
+    import httpx
+
+    from chuk_mcp_open_meteo.models import FullConditionsResponse
+    from chuk_mcp_open_meteo.server import get_full_conditions, set_shared_client
+
+    hosts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(200, json={"latitude": 50.0, "longitude": -5.0})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        set_shared_client(client)
+        try:
+            land = await get_full_conditions(latitude=50.0, longitude=-5.0)
+            coast = await get_full_conditions(latitude=50.0, longitude=-5.0, include_marine=True)
+        finally:
+            set_shared_client(None)
+
+    assert isinstance(land, FullConditionsResponse)
+    assert land.marine is None
+    assert coast.marine is not None and coast.forecast is land.forecast
+    assert sorted(hosts) == [
+        "air-quality-api.open-meteo.com",
+        "api.open-meteo.com",
+        "marine-api.open-meteo.com",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_full_conditions_tolerates_failed_extras():
+    """Test that a failed air quality request is reported instead of failing the call."""
+    import httpx
+
+    from chuk_mcp_open_meteo.server import get_full_conditions, set_shared_client
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "air-quality-api.open-meteo.com":
+            return httpx.Response(503, request=request)
+        return httpx.Response(200, json={"latitude": 50.0, "longitude": -5.0})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        set_shared_client(client)
+        try:
+            conditions = await get_full_conditions(latitude=50.0, longitude=-5.0)
+            skipped = await get_full_conditions(
+                latitude=50.0, longitude=-5.0, include_air_quality=False
+            )
+        finally:
+            set_shared_client(None)
+
+    assert conditions.forecast is not None and conditions.air_quality is None
+    assert len(conditions.errors) == 1 and conditions.errors[0].startswith("air_quality: ")
+    assert skipped.air_quality is None and skipped.errors == []
+
+
+# --- Input Validation Tests ---
+
+
+@pytest.mark.asyncio
+async def test_invalid_arguments_are_rejected_before_http():
+    """Test that out-of-range arguments raise ValueError without any request."""
+    import httpx
+
+    from chuk_mcp_open_meteo.server import set_shared_client
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, json={})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        set_shared_client(client)
+        try:
+            with pytest.raises(ValueError, match="latitude"):
+                await get_weather_forecast(latitude=91.0, longitude=0.0)
+            with pytest.raises(ValueError, match="longitude"):
+                await get_air_quality(latitude=0.0, longitude=-180.5)
+            with pytest.raises(ValueError, match="forecast_days"):
+                await get_marine_forecast(latitude=0.0, longitude=0.0, forecast_days=17)
+            with pytest.raises(ValueError, match="YYYY-MM-DD"):
+                await get_historical_weather(
+                    latitude=0.0, longitude=0.0, start_date="2024-01-01", end_date="yesterday"
+                )
+            with pytest.raises(ValueError, match="after end_date"):
+                await get_historical_weather(
+                    latitude=0.0, longitude=0.0, start_date="2024-02-01", end_date="2024-01-01"
+                )
+        finally:
+            set_shared_client(None)
+
+    assert calls == []
+
+
+# --- HTTP Client Tests ---
+
+
+@pytest.mark.asyncio
+async def test_set_shared_client_is_used_by_tools():
+    """Test that tools route requests through the registered shared client."""
+    import httpx
+
+    from chuk_mcp_open_meteo.server import set_shared_client
+
+    hosts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(
+            200,
+            json={"results": [{"name": "London", "latitude": 51.5072, "longitude": -0.1276}]},
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        set_shared_client(client)
+        try:
+            result = await geocode_location(name="London", count=1)
+        finally:
+            set_shared_client(None)
+
+    assert hosts == ["geocoding-api.open-meteo.com"]
+    assert isinstance(result, GeocodingResponse)
+    assert result.results[0].name == "London"
+
+
+@pytest.mark.asyncio
+async def test_default_client_is_pooled_across_calls():
+    """Test that tool calls without a shared client reuse one pooled client."""
+    from chuk_mcp_open_meteo._http import aclose_default_client, http_client
+
+    async with http_client() as first:
+        pass
+    async with http_client() as second:
+        pass
+    assert first is second and not first.is_closed
+    assert first.timeout.read == 30.0 and first.timeout.connect == 10.0
+
+    await aclose_default_client()
+    assert first.is_closed
+    async with http_client() as third:
+        pass
+    assert third is not first
+    await aclose_default_client()
+
+
+@pytest.mark.asyncio
+async def test_batch_fetch_handles_list_and_single_responses():
+    """Test that batch_fetch wraps both multi-location and single-location payloads."""
+    import httpx
+
+    from chuk_mcp_open_meteo._batch import batch_fetch
+    from chuk_mcp_open_meteo.models import WeatherForecast
+    from chuk_mcp_open_meteo.server import set_shared_client
+
+    payloads = [
+        [{"latitude": 51.5, "longitude": -0.13}, {"latitude": 48.85, "longitude": 2.35}],
+        {"latitude": 40.71, "longitude": -74.0},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=payloads.pop(0))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        set_shared_client(client)
+        try:
+            many = await batch_fetch("https://example.test/v1", {}, WeatherForecast)
+            single = await batch_fetch("https://example.test/v1", {}, WeatherForecast)
+        finally:
+            set_shared_client(None)
+
+    assert [f.latitude for f in many] == [51.5, 48.85]
+    assert all(isinstance(f, WeatherForecast) for f in many)
+    assert len(single) == 1 and single[0].longitude == -74.0
+
+
+# --- Response Cache Tests ---
+
+
+@pytest.mark.asyncio
+async def test_weather_forecast_is_cached():
+    """Test that repeated forecast calls within the TTL skip the network."""
+    import httpx
+
+    from chuk_mcp_open_meteo.server import set_shared_client
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, json={"latitude": 51.5, "longitude": -0.13})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        set_shared_client(client)
+        try:
+            first = await get_weather_forecast(latitude=51.5072, longitude=-0.1276)
+            second = await get_weather_forecast(latitude=51.50721, longitude=-0.12761)
+            other = await get_weather_forecast(latitude=51.5072, longitude=-0.1276, forecast_days=3)
+        finally:
+            set_shared_client(None)
+
+    assert len(calls) == 2
+    assert second is first
+    assert other is not first
+
+
+@pytest.mark.asyncio
+async def test_geocoding_is_cached_across_single_and_batch():
+    """Test that batch geocoding reuses results cached by geocode_location."""
+    import httpx
+
+    from chuk_mcp_open_meteo.server import set_shared_client
+
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.url.params["name"])
+        return httpx.Response(
+            200, json={"results": [{"name": "London", "latitude": 51.5, "longitude": -0.13}]}
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        set_shared_client(client)
+        try:
+            first = await geocode_location(name="London", count=10)
+            again = await geocode_location(name="London", count=10)
+            batch = await batch_geocode_locations(names="London,Paris", count=10)
+        finally:
+            set_shared_client(None)
+
+    assert again is first
+    assert queries == ["London", "Paris"]
+    assert batch.successful == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_fetch():
+    """Test that concurrent calls for the same forecast issue a single HTTP request."""
+    import asyncio
+
+    import httpx
+
+    from chuk_mcp_open_meteo.server import set_shared_client
+
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"latitude": 51.5, "longitude": -0.13})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        set_shared_client(client)
+        try:
+            results = await asyncio.gather(
+                *[get_weather_forecast(latitude=51.5072, longitude=-0.1276) for _ in range(5)]
+            )
+        finally:
+            set_shared_client(None)
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_response_cache_evicts_least_recently_used():
+    """Test that a full cache drops the entry that was used longest ago."""
+    from chuk_mcp_open_meteo._cache import TTLCache
+
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=60)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_historical_ttl():
+    """Test that settled archive ranges are cached longer than recent ones."""
+    from datetime import date, timedelta
+
+    from chuk_mcp_open_meteo._cache import FORECAST_TTL, HISTORICAL_TTL, historical_ttl
+
+    assert historical_ttl("2024-01-07") == HISTORICAL_TTL
+    assert historical_ttl(date.today().isoformat()) == FORECAST_TTL
+    # The archive's last few days are still provisional
+    assert historical_ttl((date.today() - timedelta(days=3)).isoformat()) == FORECAST_TTL
+    assert historical_ttl("not-a-date") == FORECAST_TTL
+
+
+# --- Model Helper Tests ---
+
+
+def test_time_series_as_array():
+    """Test packing a nullable column into a float array with NaN for gaps."""
+    import math
+
+    from chuk_mcp_open_meteo.models import HourlyAirQuality
+
+    hourly = HourlyAirQuality(time=["2024-01-01T00:00", "2024-01-01T01:00"], pm2_5=[12.5, None])
+
+    pm2_5 = hourly.as_array("pm2_5")
+    assert pm2_5.typecode == "d"
+    assert pm2_5[0] == 12.5
+    assert math.isnan(pm2_5[1])
+    assert len(hourly.as_array("ozone")) == 0
+
+    pm2_5_f32 = hourly.as_array("pm2_5", "f")
+    assert pm2_5_f32.itemsize == 4
+    assert pm2_5_f32[0] == 12.5
+    assert math.isnan(pm2_5_f32[1])
+
+    with pytest.raises(ValueError):
+        hourly.as_array("pm2_5", "i")
+
+
+def test_time_series_rows():
+    """Test iterating several columns as per-timestep records."""
+    from chuk_mcp_open_meteo.models import HourlyMarine
+
+    hourly = HourlyMarine(
+        time=["2024-01-01T00:00", "2024-01-01T01:00"],
+        wave_height=[2.5, 1.0],
+        wave_period=[12.0, None],
+    )
+
+    assert list(hourly.rows("wave_height", "wave_period")) == [
+        ("2024-01-01T00:00", 2.5, 12.0),
+        ("2024-01-01T01:00", 1.0, None),
+    ]
+    assert list(hourly.rows("swell_wave_height")) == [
+        ("2024-01-01T00:00", None),
+        ("2024-01-01T01:00", None),
+    ]
+
+
+def test_time_series_column():
+    """Test missing columns come back as a shared empty sequence."""
+    from chuk_mcp_open_meteo.models import DailyWeather
+
+    daily = DailyWeather(time=["2024-01-01"], precipitation_sum=[1.5])
+    assert daily.column("precipitation_sum") == [1.5]
+    assert daily.column("rain_sum") == ()
+    assert daily.column("rain_sum") is daily.column("sunrise")
+
+
+def test_time_series_epoch_seconds():
+    """Test the time column as packed epoch seconds, on and off a uniform grid."""
+    from chuk_mcp_open_meteo.models import DailyWeather, HourlyWeather
+
+    hourly = HourlyWeather(time=["1970-01-01T00:00", "1970-01-01T01:00", "1970-01-01T02:00"])
+    assert hourly.epoch_seconds().typecode == "q"
+    assert list(hourly.epoch_seconds()) == [0, 3600, 7200]
+
+    daily = DailyWeather(time=["1970-01-01", "1970-01-02", "1970-01-04"])
+    assert list(daily.epoch_seconds()) == [0, 86400, 259200]
+    assert list(DailyWeather(time=[]).epoch_seconds()) == []
+
+
+def test_current_weather_weathercode_text():
+    """Test the weather code description shortcut on current conditions."""
+    from chuk_mcp_open_meteo.models import CurrentWeather
+
+    fields = {"temperature": 12.5, "windspeed": 10.0, "winddirection": 180.0, "time": "t"}
+    assert CurrentWeather(weathercode=2, **fields).weathercode_text == "Partly cloudy"
+    assert CurrentWeather(weathercode=4, **fields).weathercode_text == "Unknown weather code: 4"
+    assert CurrentWeather(weathercode=-1, **fields).weathercode_text == "Unknown weather code: -1"
+
+
+def test_from_raw_builds_nested_models():
+    """Test trusted-payload construction matches full validation."""
+    from chuk_mcp_open_meteo.models import CurrentWeather, HourlyWeather, WeatherForecast
+
+    data = {
+        "latitude": 51.5,
+        "longitude": -0.13,
+        "current_weather": {
+            "temperature": 12.5,
+            "windspeed": 10.0,
+            "winddirection": 180.0,
+            "weathercode": 3,
+            "time": "2024-01-01T00:00",
+        },
+        "hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [12.5], "is_day": [0]},
+    }
+
+    forecast = WeatherForecast.from_raw(data)
+    assert isinstance(forecast.current_weather, CurrentWeather)
+    assert isinstance(forecast.hourly, HourlyWeather)
+    assert forecast.hourly.is_day == [0]
+    assert forecast.daily is None
+    assert forecast.model_dump() == WeatherForecast.from_raw(data, strict=True).model_dump()
+
+
+def test_response_models_are_frozen():
+    """Test cached response models cannot be modified in place."""
+    from pydantic import ValidationError
+
+    from chuk_mcp_open_meteo.models import GeocodingResult, HourlyWeather
+
+    hourly = HourlyWeather(time=["2024-01-01T00:00"], temperature_2m=[1.0])
+    with pytest.raises(ValidationError):
+        hourly.temperature_2m = [2.0]
+    with pytest.raises(ValidationError):
+        GeocodingResult(name="London", latitude=51.5, longitude=-0.13).name = "Paris"
+
+
+def test_schema_with_descriptions():
+    """Test that field descriptions are merged into model and nested model schemas."""
+    from chuk_mcp_open_meteo.models import WeatherForecast
+    from chuk_mcp_open_meteo.models_descriptions import DESCRIPTIONS, schema_with_descriptions
+
+    assert "description" not in WeatherForecast.model_json_schema()["properties"]["latitude"]
+
+    schema = schema_with_descriptions(WeatherForecast)
+    assert schema["properties"]["latitude"]["description"] == "Latitude of the location"
+    current = schema["$defs"]["CurrentWeather"]["properties"]["temperature"]
+    assert current["description"] == DESCRIPTIONS["CurrentWeather"]["temperature"]